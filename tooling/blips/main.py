@@ -6,36 +6,158 @@ A tool to create and edit Hugo blip posts with AI-powered editing capabilities.
 """
 
 import argparse
+import asyncio
+import difflib
 import json
 import os
+import shutil
+import string
 import subprocess
 import sys
 import tempfile
+import time
 import hashlib
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-
-import openai
+from typing import List, Optional, Dict, Any, Tuple, Union
 
 # Add parent directory to path to import shared utilities
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.config import config_manager
 
+OPENAI_MODEL = "gpt-4o"  # Using gpt-4o as gpt-5 isn't available yet
+TEMPERATURE = 0.7
+
+# Retries on rate limits, timeouts and connection errors, with the SDK's backoff
+MAX_RETRIES = 2
+# Fail fast on a dead connection; the read timeout applies between streamed chunks
+REQUEST_TIMEOUT = 60.0
+CONNECT_TIMEOUT = 5.0
+
+# Completed rewrites keyed by model, temperature, prompt and content; only used with --cache
+RESPONSE_CACHE_DIR = Path.home() / ".cache" / "carinthia" / "blips"
+RESPONSE_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days in seconds
+
+# Seconds between status checks while a batch is processing
+BATCH_POLL_INTERVAL = 30
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Most custom prompts sent to OpenAI at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Versions kept for undo; older ones are folded into the base
+MAX_VERSIONS = 32
+
+# Frontmatter for a new blip
+_ARCHETYPE = string.Template("""+++
+title = 'New Blip'
+date = $date
+draft = false
+tags = []
++++
+
+
+""")
+
+
+@lru_cache(maxsize=128)
+def _read_prompt(path_str: str, mtime_ns: int) -> str:
+    """Read a prompt file; keyed on mtime so an edited prompt is picked up."""
+    return Path(path_str).read_text().strip()
+
+
+@lru_cache(maxsize=8)
+def _list_prompts(dir_str: str, mtime_ns: int) -> tuple[Path, ...]:
+    """Glob the prompts directory; keyed on its mtime so added or removed files are seen."""
+    return tuple(Path(dir_str).glob("*.txt"))
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Replace a file's content so readers never see a partial write."""
+    with tempfile.NamedTemporaryFile('w', dir=path.parent, prefix=f".{path.name}.", delete=False) as tmp:
+        tmp.write(content)
+    try:
+        # Keep the original permissions rather than the temp file's 0600
+        if path.exists():
+            os.chmod(tmp.name, path.stat().st_mode & 0o7777)
+        os.replace(tmp.name, path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+
 
 class VersionStack:
-    """Manages undo/redo stack for blip content versions."""
+    """Manages undo/redo stack for blip content versions.
+
+    Only the first version is stored whole; every later one is kept as a
+    line diff against its predecessor and rebuilt on demand.
+    """
 
     def __init__(self):
-        self.versions: List[str] = []
+        self.base: Optional[str] = None
+        # patches[i] turns version i into version i + 1
+        self.patches: List[List[Tuple[int, int, Tuple[str, ...]]]] = []
         self.current_index: int = -1
+        # Most recently materialized versions, so stepping back and forth is cheap
+        self._materialized: Dict[int, str] = {}
+
+    def _version(self, index: int) -> str:
+        """Rebuild a version by applying the patches to the base."""
+        if index in self._materialized:
+            return self._materialized[index]
+
+        lines = self.base.splitlines(keepends=True)
+        for patch in self.patches[:index]:
+            # Apply back to front so earlier indices stay valid
+            for i1, i2, replacement in reversed(patch):
+                lines[i1:i2] = replacement
+
+        content = ''.join(lines)
+        if len(self._materialized) >= 2:
+            self._materialized.pop(next(iter(self._materialized)))
+        self._materialized[index] = content
+        return content
 
     def push(self, content: str) -> None:
         """Add new version and clear any redo history."""
+        if self.base is None:
+            self.base = content
+            self.current_index = 0
+            self._materialized = {0: content}
+            return
+
+        previous = self._version(self.current_index)
+        if content == previous:
+            return
+
         # Remove any versions after current index (redo history)
-        self.versions = self.versions[:self.current_index + 1]
-        self.versions.append(content)
-        self.current_index = len(self.versions) - 1
+        if self.can_redo():
+            del self.patches[self.current_index:]
+            for index in [k for k in self._materialized if k > self.current_index]:
+                del self._materialized[index]
+
+        old_lines = previous.splitlines(keepends=True)
+        new_lines = content.splitlines(keepends=True)
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        self.patches.append([
+            (i1, i2, tuple(new_lines[j1:j2]))
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal'
+        ])
+        self.current_index += 1
+        if len(self._materialized) >= 2:
+            self._materialized.pop(next(iter(self._materialized)))
+        self._materialized[self.current_index] = content
+
+        if len(self.patches) >= MAX_VERSIONS:
+            self._drop_oldest()
+
+    def _drop_oldest(self) -> None:
+        """Forget the oldest version by making the second one the new base."""
+        self.base = self._version(1)
+        del self.patches[0]
+        self.current_index -= 1
+        self._materialized = {k - 1: v for k, v in self._materialized.items() if k > 0}
 
     def can_undo(self) -> bool:
         """Check if undo is available."""
@@ -43,63 +165,96 @@ class VersionStack:
 
     def can_redo(self) -> bool:
         """Check if redo is available."""
-        return self.current_index < len(self.versions) - 1
+        return self.base is not None and self.current_index < len(self.patches)
 
     def undo(self) -> Optional[str]:
         """Move back one version."""
         if self.can_undo():
             self.current_index -= 1
-            return self.versions[self.current_index]
+            return self._version(self.current_index)
         return None
 
     def redo(self) -> Optional[str]:
         """Move forward one version."""
         if self.can_redo():
             self.current_index += 1
-            return self.versions[self.current_index]
+            return self._version(self.current_index)
         return None
 
     def current(self) -> Optional[str]:
         """Get current version."""
-        if 0 <= self.current_index < len(self.versions):
-            return self.versions[self.current_index]
+        if self.current_index >= 0:
+            return self._version(self.current_index)
         return None
 
 
 class BlipTool:
     """Main blip creation and editing tool."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, auto_edit: bool = True, use_cache: bool = False):
         self.project_root = project_root
+        self.use_cache = use_cache
+        # Open the editor after each AI pass; off lets passes run back to back
+        self.auto_edit = auto_edit
         self.tooling_root = project_root / "tooling" / "blips"
         self.prompts_dir = self.tooling_root / "prompts"
+        self.blips_dir = project_root / "content" / "blips"
+        self.deploy_script = project_root / "deploy.sh"
         self.version_stack = VersionStack()
 
         # Check if OpenAI API key is available
         self.has_openai_key = config_manager.has_api_key('OPENAI_API_KEY')
 
-        # Initialize OpenAI client if key is available
-        if self.has_openai_key:
-            api_key = config_manager.get_api_key('OPENAI_API_KEY')
-            self.openai_client = openai.OpenAI(api_key=api_key)
-        else:
-            self.openai_client = None
+        # Created on first AI use by _client
+        self.openai_client = None
+
+        # One loop for the whole session so the async client keeps its connections
+        self._loop = asyncio.new_event_loop()
+
+        # Digest of what the blip on disk holds, when known, so unchanged writes can be skipped
+        self._disk_digest: Optional[bytes] = None
+
+        # Menu text and choices per (has key, can undo, can redo)
+        self._menu_cache: Dict[Tuple[bool, bool, bool], Tuple[str, Dict[str, str]]] = {}
+
+        # Resolved on first use by find_editor
+        self._editor: Optional[str] = None
+
 
 
+    def _client(self):
+        """Return the OpenAI client, importing the SDK on first use."""
+        if self.openai_client is None:
+            # The SDK takes a noticeable time to import; manual-only sessions never need it
+            import openai
+
+            self.openai_client = openai.AsyncOpenAI(
+                api_key=config_manager.get_api_key('OPENAI_API_KEY'),
+                max_retries=MAX_RETRIES,
+                timeout=openai.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+            )
+        return self.openai_client
+
+    def close(self) -> None:
+        """Close the OpenAI client's connections and the event loop."""
+        if self.openai_client:
+            self._loop.run_until_complete(self.openai_client.close())
+        self._loop.close()
 
     def find_editor(self) -> str:
         """Find available text editor."""
+        if self._editor:
+            return self._editor
+
         # Get blip editor from config manager
         editor = config_manager.get_blip_editor()
 
-        # Check if the editor exists
-        if subprocess.run(['which', editor], capture_output=True).returncode == 0:
-            return editor
-
-        # Try fallbacks if configured editor doesn't exist
-        for fallback_editor in ['vim', 'nano']:
-            if subprocess.run(['which', fallback_editor], capture_output=True).returncode == 0:
-                return fallback_editor
+        # Try the configured editor first, then fallbacks if it doesn't exist
+        for candidate in [editor, 'vim', 'nano']:
+            path = shutil.which(candidate)
+            if path:
+                self._editor = path
+                return path
 
         print(f"Error: No text editor found. Configured blip editor '{editor}' not available.")
         print("Please install the configured editor or set BLIP_EDITOR/EDITOR environment variable.")
@@ -109,31 +264,31 @@ class BlipTool:
         """Create a new blip file with archetype template."""
         # Generate timestamp and filename
         now = datetime.now(timezone.utc)
-        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
         filename = f"blip-{now.strftime('%Y%m%d-%H%M%S')}.md"
 
         # Create blip content from archetype
-        content = f"""+++
-title = 'New Blip'
-date = {now.isoformat()}
-draft = false
-tags = []
-+++
-
-
-"""
+        content = _ARCHETYPE.substitute(date=now.isoformat())
 
-        blip_path = self.project_root / "content" / "blips" / filename
+        self.blips_dir.mkdir(parents=True, exist_ok=True)
+        blip_path = self.blips_dir / filename
         blip_path.write_text(content)
 
         return blip_path
 
-    def edit_file(self, file_path: Path) -> bool:
-        """Open file in editor and return True if saved."""
+    def edit_file(self, file_path: Path, content: Optional[str] = None) -> Optional[str]:
+        """Open file in editor and return the new content if it was changed.
+
+        Pass the content just written to the file to avoid reading it back.
+        """
         editor = self.find_editor()
 
-        # Get original modification time
-        orig_mtime = file_path.stat().st_mtime if file_path.exists() else 0
+        # Hash the content rather than compare mtimes, which can miss saves within the same second
+        if content is not None:
+            orig_digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        elif file_path.exists():
+            orig_digest = hashlib.blake2b(file_path.read_bytes(), digest_size=16).digest()
+        else:
+            orig_digest = None
 
         # Build editor command with vim-specific options
         if 'vim' in editor.lower():
@@ -146,33 +301,57 @@ tags = []
         # Open editor
         result = subprocess.run(cmd)
 
+        # The editor may have written the file either way
+        self._disk_digest = None
+
         if result.returncode != 0:
-            return False
+            return None
 
         # Check if file was modified
         if not file_path.exists():
-            return False
+            return None
+
+        new = file_path.read_bytes()
+        self._disk_digest = hashlib.blake2b(new, digest_size=16).digest()
+        if self._disk_digest == orig_digest:
+            return None
+
+        return new.decode()
+
+    def _write_blip(self, blip_path: Path, content: str) -> None:
+        """Write the blip being edited, skipping the write if the file already holds the content."""
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        if digest == self._disk_digest:
+            return
 
-        new_mtime = file_path.stat().st_mtime
-        return new_mtime > orig_mtime
+        _write_atomic(blip_path, content)
+        self._disk_digest = digest
 
     def get_prompts(self) -> List[Path]:
         """Get list of available prompt files."""
         if not self.prompts_dir.exists():
             return []
 
-        return list(self.prompts_dir.glob("*.txt"))
+        return list(_list_prompts(str(self.prompts_dir), self.prompts_dir.stat().st_mtime_ns))
 
-    def select_prompt(self) -> Optional[Path]:
-        """Let user select a prompt file."""
+    def read_prompt(self, prompt_file: Path) -> str:
+        """Read a prompt file's text."""
+        return _read_prompt(str(prompt_file), prompt_file.stat().st_mtime_ns)
+
+    def get_prompts_with_contents(self) -> List[Tuple[Path, str]]:
+        """Get every prompt file together with its text."""
+        return [(prompt_file, self.read_prompt(prompt_file)) for prompt_file in self.get_prompts()]
+
+    def select_prompts(self) -> List[Path]:
+        """Let user select one or more prompt files."""
         prompts = self.get_prompts()
 
         if not prompts:
             print("No prompt files found in prompts directory.")
-            return None
+            return []
 
         if len(prompts) == 1:
-            return prompts[0]
+            return prompts
 
         print("\nAvailable prompts:")
         for i, prompt_file in enumerate(prompts, 1):
@@ -180,34 +359,39 @@ tags = []
 
         while True:
             try:
-                choice = int(input("\nSelect prompt (number): ")) - 1
-                if 0 <= choice < len(prompts):
-                    return prompts[choice]
+                choices = [int(choice) - 1 for choice in input("\nSelect prompts (e.g. 1 or 1,3): ").split(',')]
+                if all(0 <= choice < len(prompts) for choice in choices):
+                    # Keep the order given, without repeats
+                    return [prompts[choice] for choice in dict.fromkeys(choices)]
                 print("Invalid selection.")
             except (ValueError, KeyboardInterrupt):
-                return None
+                return []
 
     def parse_hugo_content(self, full_content: str) -> tuple[str, str]:
         """Parse Hugo content into frontmatter and body content."""
-        lines = full_content.split('\n')
-
-        if not lines or not lines[0].strip() == '+++':
+        first_end = full_content.find('\n')
+        if first_end == -1 or full_content[:first_end].strip() != '+++':
             # No frontmatter found
             return '', full_content
 
-        # Find end of frontmatter
-        frontmatter_end = -1
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == '+++':
-                frontmatter_end = i
+        # Find end of frontmatter: the next line that is just +++
+        pos = first_end
+        while True:
+            pos = full_content.find('+++', pos + 1)
+            if pos == -1:
+                # No closing +++, treat as no frontmatter
+                return '', full_content
+
+            line_start = full_content.rfind('\n', 0, pos) + 1
+            line_end = full_content.find('\n', pos)
+            if line_end == -1:
+                line_end = len(full_content)
+            if full_content[line_start:line_end].strip() == '+++':
                 break
+            pos = line_end
 
-        if frontmatter_end == -1:
-            # No closing +++, treat as no frontmatter
-            return '', full_content
-
-        frontmatter = '\n'.join(lines[:frontmatter_end + 1])
-        content = '\n'.join(lines[frontmatter_end + 1:]).lstrip('\n')
+        frontmatter = full_content[:line_end]
+        content = full_content[line_end + 1:].lstrip('\n')
 
         return frontmatter, content
 
@@ -216,86 +400,323 @@ tags = []
         if not frontmatter:
             return content
 
-        return frontmatter + '\n\n' + content
+        # One allocation instead of two intermediate concatenations
+        return ''.join((frontmatter, '\n\n', content))
+
+    def _response_cache_path(self, content: str, prompt: str) -> Path:
+        """Return the cache file for a rewrite of content with prompt."""
+        key = hashlib.sha256(f"{OPENAI_MODEL}|{TEMPERATURE}|{prompt}|{content}".encode()).hexdigest()
+        return RESPONSE_CACHE_DIR / f"{key}.txt"
 
-    def call_openai(self, content: str, prompt: str) -> str:
-        """Call OpenAI API with content and prompt."""
+    def _read_cached_response(self, content: str, prompt: str) -> Optional[str]:
+        """Return a rewrite generated within RESPONSE_CACHE_TTL, or None."""
+        if not self.use_cache:
+            return None
+        cache_path = self._response_cache_path(content, prompt)
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",  # Using gpt-4o as gpt-5 isn't available yet
-                messages=[
-                    {"role": "system", "content": prompt},
-                    {"role": "user", "content": content}
-                ],
-                temperature=0.7
-            )
+            if time.time() - cache_path.stat().st_mtime >= RESPONSE_CACHE_TTL:
+                return None
+            cached = cache_path.read_text()
+        except OSError:
+            return None
+
+        print("(Using a cached response; run without --cache for a fresh one)")
+        return cached
+
+    def _write_cached_response(self, content: str, prompt: str, response: str) -> None:
+        """Store a rewrite for later runs; a failed write only costs a future cache hit."""
+        if not self.use_cache or not response:
+            return
+        try:
+            RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self._response_cache_path(content, prompt), response)
+        except OSError as e:
+            print(f"Warning: could not cache response: {e}")
+
+    async def _call_openai_async(self, content: str, prompt: str) -> str:
+        """Stream the completion to the terminal as it arrives and return the full text."""
+        cached = self._read_cached_response(content, prompt)
+        if cached is not None:
+            print(cached)
+            return cached
+
+        stream = await self._client().chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": content}
+            ],
+            temperature=TEMPERATURE,
+            stream=True
+        )
+
+        parts = []
+        # Closes the response if the task is cancelled mid-stream
+        async with stream:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    sys.stdout.write(delta)
+                    sys.stdout.flush()
+        print()
+
+        response = ''.join(parts).strip()
+        self._write_cached_response(content, prompt, response)
+        return response
+
+    def call_openai(self, content: str, prompt: str) -> Optional[str]:
+        """Call OpenAI API with content and prompt; returns None if it fails or Ctrl-C stops it."""
+        task = self._loop.create_task(self._call_openai_async(content, prompt))
+        try:
+            return self._loop.run_until_complete(task)
 
-            return response.choices[0].message.content.strip()
+        except KeyboardInterrupt:
+            # Let the task unwind so the streamed response is closed
+            task.cancel()
+            try:
+                self._loop.run_until_complete(task)
+            except (asyncio.CancelledError, Exception):
+                pass
+            print("\nAborted; keeping the current version.")
+            return None
 
         except Exception as e:
             print(f"Error calling OpenAI API: {e}")
-            return content
+            return None
 
     def copyread_blip(self, blip_path: Path) -> bool:
         """Run copyread process on blip."""
-        prompt_file = self.select_prompt()
-        if not prompt_file:
+        prompt_files = self.select_prompts()
+        if not prompt_files:
             return False
 
-        # Read prompt and current content
-        prompt = prompt_file.read_text().strip()
-        full_content = blip_path.read_text()
+        print(f"\nProcessing with prompt: {', '.join(p.stem for p in prompt_files)}")
+        return self._run_prompts(blip_path, [p.stem for p in prompt_files],
+                                 [self.read_prompt(p) for p in prompt_files])
 
-        # Parse frontmatter and content
-        frontmatter, content = self.parse_hugo_content(full_content)
+    async def _call_openai_all_async(self, content: str, prompts: List[str]) -> List[str]:
+        """Apply every prompt to the content in one request and return the rewrites in order."""
+        instructions = '\n\n'.join(f"Instruction {i}:\n{prompt}" for i, prompt in enumerate(prompts, 1))
+        system_prompt = f"""For each of the following {len(prompts)} instructions, produce the rewritten article by applying that instruction alone to the original article.
 
-        print(f"\nProcessing with prompt: {prompt_file.stem}")
-        processed_content = self.call_openai(content, prompt)
+Return a JSON object of the form {{"variants": [...]}} where "variants" is an array of exactly {len(prompts)} strings, one rewritten article per instruction, in order. Each string must contain only the rewritten article, without commentary.
 
-        # Reconstruct full content with original frontmatter
-        full_processed_content = self.reconstruct_hugo_content(frontmatter, processed_content)
+{instructions}"""
 
-        # Save to version stack and update file
-        self.version_stack.push(full_processed_content)
-        blip_path.write_text(full_processed_content)
+        response = await self._client().chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": content}
+            ],
+            temperature=TEMPERATURE,
+            response_format={"type": "json_object"}
+        )
 
-        # Open in editor
-        return self.edit_file(blip_path)
+        variants = json.loads(response.choices[0].message.content)["variants"]
+        if not isinstance(variants, list) or len(variants) != len(prompts):
+            raise ValueError(f"expected {len(prompts)} variants, got {len(variants)}")
 
-    def custom_ai_processing(self, blip_path: Path) -> bool:
-        """Run custom AI processing on blip."""
-        user_prompt = input("\nEnter your custom prompt: ").strip()
-        if not user_prompt:
+        return [str(variant).strip() for variant in variants]
+
+    def copyread_blip_all(self, blip_path: Path) -> bool:
+        """Run every predefined prompt on the blip in a single request."""
+        prompts_with_contents = self.get_prompts_with_contents()
+        if not prompts_with_contents:
+            print("No prompt files found in prompts directory.")
+            return False
+
+        prompt_files = [prompt_file for prompt_file, _ in prompts_with_contents]
+        prompts = [prompt for _, prompt in prompts_with_contents]
+        full_content = blip_path.read_text()
+
+        # Parse frontmatter and content
+        frontmatter, content = self.parse_hugo_content(full_content)
+
+        print(f"\nProcessing with prompts: {', '.join(p.stem for p in prompt_files)}")
+        try:
+            variants = self._loop.run_until_complete(self._call_openai_all_async(content, prompts))
+        except Exception as e:
+            print(f"Error calling OpenAI API: {e}")
             return False
 
-        # Enhance prompt to return only processed content
-        enhanced_prompt = f"""Process the following text according to this instruction: {user_prompt}
+        # Stack every variant so undo/redo steps between them; the last one ends up in the file
+        for prompt_file, variant in zip(prompt_files, variants):
+            full_processed_content = self.reconstruct_hugo_content(frontmatter, variant)
+            self.version_stack.push(full_processed_content)
+            print(f"Added version: {prompt_file.stem}")
 
-Return ONLY the processed text content, without any additional commentary, explanations, or meta-text like "Here is your edited version:" or similar. Just return the direct result."""
+        self._write_blip(blip_path, full_processed_content)
+        print(f"Showing {prompt_files[-1].stem}; use undo/redo to switch between versions.")
+
+        # Open in editor
+        if not self.auto_edit:
+            return True
+        return self.edit_file(blip_path, full_processed_content) is not None
+
+    async def _submit_batch_async(self, blip_paths: List[Path], prompt: str) -> int:
+        """Run the prompt over every blip as one Batch API job and write the results back."""
+        frontmatters = {}
+        lines = []
+        for blip_path in blip_paths:
+            frontmatter, content = self.parse_hugo_content(blip_path.read_text())
+            frontmatters[str(blip_path)] = frontmatter
+            lines.append(json.dumps({
+                "custom_id": str(blip_path),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": OPENAI_MODEL,
+                    "messages": [
+                        {"role": "system", "content": prompt},
+                        {"role": "user", "content": content}
+                    ],
+                    "temperature": TEMPERATURE
+                }
+            }))
+
+        input_file = await self._client().files.create(
+            file=("blips.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await self._client().batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"Submitted batch {batch.id} with {len(lines)} blips. Waiting for results...")
+
+        while batch.status not in BATCH_FINAL_STATUSES:
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            batch = await self._client().batches.retrieve(batch.id)
+
+        if not batch.output_file_id:
+            print(f"Batch {batch.id} {batch.status} without output.")
+            return 0
+
+        updated = 0
+        output = await self._client().files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            entry = json.loads(line)
+            blip_path = Path(entry["custom_id"])
+            response = entry.get("response") or {}
+            if response.get("status_code") != 200:
+                print(f"Failed: {blip_path.name}: {entry.get('error')}")
+                continue
+
+            processed_content = response["body"]["choices"][0]["message"]["content"].strip()
+            _write_atomic(blip_path, self.reconstruct_hugo_content(frontmatters[entry["custom_id"]], processed_content))
+            print(f"Updated: {blip_path.name}")
+            updated += 1
+
+        return updated
+
+    def submit_batch(self, blip_paths: List[Path], prompt: str) -> int:
+        """Process several blips with one prompt through the Batch API; returns the number updated."""
+        try:
+            return self._loop.run_until_complete(self._submit_batch_async(blip_paths, prompt))
 
-        # Process content
+        except Exception as e:
+            print(f"Error running OpenAI batch: {e}")
+            return 0
+
+    async def _process_many(self, content: str, prompts: List[str]) -> List[Union[str, BaseException]]:
+        """Run each prompt on the content concurrently; failures are returned in place of the text."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def process(prompt: str) -> str:
+            cached = self._read_cached_response(content, prompt)
+            if cached is not None:
+                return cached
+
+            async with semaphore:
+                response = await self._client().chat.completions.create(
+                    model=OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": prompt},
+                        {"role": "user", "content": content}
+                    ],
+                    temperature=TEMPERATURE
+                )
+            processed_content = response.choices[0].message.content.strip()
+            self._write_cached_response(content, prompt, processed_content)
+            return processed_content
+
+        return await asyncio.gather(*(process(prompt) for prompt in prompts), return_exceptions=True)
+
+    def _run_prompts(self, blip_path: Path, labels: List[str], prompts: List[str]) -> bool:
+        """Run prompts on the blip body, stack each result and open the last one in the editor."""
         full_content = blip_path.read_text()
 
         # Parse frontmatter and content
         frontmatter, content = self.parse_hugo_content(full_content)
 
-        processed_content = self.call_openai(content, enhanced_prompt)
+        if len(prompts) == 1:
+            # A single prompt streams to the terminal
+            results = [self.call_openai(content, prompts[0])]
+        else:
+            print(f"\nRunning {len(prompts)} prompts...")
+            try:
+                results = self._loop.run_until_complete(self._process_many(content, prompts))
+            except Exception as e:
+                print(f"Error calling OpenAI API: {e}")
+                return False
 
-        # Reconstruct full content with original frontmatter
-        full_processed_content = self.reconstruct_hugo_content(frontmatter, processed_content)
+        # Stack every successful variant so undo/redo steps between them; the last one ends up in the file
+        full_processed_content = None
+        for label, result in zip(labels, results):
+            # Failures and aborts have already been reported by call_openai
+            if result is None:
+                continue
+            if isinstance(result, BaseException):
+                print(f"Error calling OpenAI API for {label}: {result}")
+                continue
+
+            # Reconstruct full content with original frontmatter
+            variant = self.reconstruct_hugo_content(frontmatter, result)
+            self.version_stack.push(variant)
+            full_processed_content = variant
+
+        if full_processed_content is None:
+            return False
 
-        # Save to version stack and update file
-        self.version_stack.push(full_processed_content)
-        blip_path.write_text(full_processed_content)
+        # Update file
+        self._write_blip(blip_path, full_processed_content)
+        if len(prompts) > 1:
+            print("Showing the last result; use undo/redo to switch between versions.")
 
         # Open in editor
-        return self.edit_file(blip_path)
+        if not self.auto_edit:
+            return True
+        return self.edit_file(blip_path, full_processed_content) is not None
+
+    def custom_ai_processing(self, blip_path: Path) -> bool:
+        """Run custom AI processing on blip."""
+        user_prompts = []
+        user_prompt = input("\nEnter your custom prompt: ").strip()
+        while user_prompt:
+            user_prompts.append(user_prompt)
+            user_prompt = input("Another prompt to run alongside (Enter to start): ").strip()
+        if not user_prompts:
+            return False
+
+        # Enhance prompts to return only processed content
+        enhanced_prompts = [f"""Process the following text according to this instruction: {user_prompt}
+
+Return ONLY the processed text content, without any additional commentary, explanations, or meta-text like "Here is your edited version:" or similar. Just return the direct result.""" for user_prompt in user_prompts]
+
+        return self._run_prompts(blip_path, [f'"{p}"' for p in user_prompts], enhanced_prompts)
 
     def undo_changes(self, blip_path: Path) -> bool:
         """Undo last change."""
         content = self.version_stack.undo()
         if content:
-            blip_path.write_text(content)
+            self._write_blip(blip_path, content)
             print("Undid last change.")
             return True
         else:
@@ -306,7 +727,7 @@ Return ONLY the processed text content, without any additional commentary, expla
         """Redo last undone change."""
         content = self.version_stack.redo()
         if content:
-            blip_path.write_text(content)
+            self._write_blip(blip_path, content)
             print("Redid last change.")
             return True
         else:
@@ -315,68 +736,61 @@ Return ONLY the processed text content, without any additional commentary, expla
 
     def deploy_blip(self) -> bool:
         """Deploy the blog."""
-        deploy_script = self.project_root / "deploy.sh"
-
-        if not deploy_script.exists():
-            print(f"Error: deploy.sh not found at {deploy_script}")
+        if not self.deploy_script.exists():
+            print(f"Error: deploy.sh not found at {self.deploy_script}")
             return False
 
         print("Deploying blog...")
-        result = subprocess.run([str(deploy_script)], cwd=self.project_root)
+        result = subprocess.run([str(self.deploy_script)], cwd=self.project_root)
         return result.returncode == 0
 
-    def show_menu(self, blip_path: Path) -> str:
-        """Show main menu and get user choice."""
-        print(f"\nBlip file: {blip_path.name}")
-        print("\nOptions:")
+    def _build_menu(self, can_undo: bool, can_redo: bool) -> Tuple[str, Dict[str, str]]:
+        """Build the menu text and the choice-to-action map for one menu state."""
+        key = (self.has_openai_key, can_undo, can_redo)
+        if key in self._menu_cache:
+            return self._menu_cache[key]
 
+        lines = []
         option_map = {}
-        current_option = 1
 
         # Add AI options only if API key is available
+        actions = []
         if self.has_openai_key:
-            print(f"{current_option}. Copyread (Predefined Prompts)")
-            option_map[str(current_option)] = 'copyread'
-            current_option += 1
+            actions += [("Copyread (Predefined Prompts)", 'copyread'),
+                        ("Copyread (All Prompts)", 'copyread_all'),
+                        ("Prompt Changes (GPT)", 'custom_ai')]
+        actions += [("Edit manually", 'edit'), ("Publish", 'publish'), ("Exit", 'exit')]
 
-            print(f"{current_option}. Prompt Changes (GPT)")
-            option_map[str(current_option)] = 'custom_ai'
-            current_option += 1
+        for number, (label, action) in enumerate(actions, 1):
+            lines.append(f"{number}. {label}")
+            option_map[str(number)] = action
 
-        print(f"{current_option}. Edit manually")
-        option_map[str(current_option)] = 'edit'
-        current_option += 1
-
-        print(f"{current_option}. Publish")
-        option_map[str(current_option)] = 'publish'
-        current_option += 1
+        # Add undo/redo options with separator
+        if can_undo or can_redo:
+            lines.append("")  # Empty line separator
 
-        print(f"{current_option}. Exit")
-        option_map[str(current_option)] = 'exit'
+        if can_undo:
+            lines.append("u. Undo")
+            option_map['u'] = 'u'
 
-        # Add undo/redo options with separator
-        if self.version_stack.can_undo() or self.version_stack.can_redo():
-            print()  # Empty line separator
+        if can_redo:
+            lines.append("r. Redo")
+            option_map['r'] = 'r'
 
-        if self.version_stack.can_undo():
-            print("u. Undo")
+        self._menu_cache[key] = ('\n'.join(lines), option_map)
+        return self._menu_cache[key]
 
-        if self.version_stack.can_redo():
-            print("r. Redo")
+    def show_menu(self, blip_path: Path) -> str:
+        """Show main menu and get user choice."""
+        menu_text, option_map = self._build_menu(self.version_stack.can_undo(), self.version_stack.can_redo())
+        print(f"\nBlip file: {blip_path.name}\n\nOptions:\n{menu_text}")
 
         while True:
             try:
                 choice = input("\nSelect option: ").strip().lower()
-                valid_choices = list(option_map.keys())
-
-                if self.version_stack.can_undo():
-                    valid_choices.append('u')
-                if self.version_stack.can_redo():
-                    valid_choices.append('r')
-
-                if choice in valid_choices:
-                    # Return the mapped action or the choice itself for u/r
-                    return option_map.get(choice, choice)
+                if choice in option_map:
+                    # Return the mapped action; u/r map to themselves
+                    return option_map[choice]
                 print("Invalid choice.")
             except (KeyboardInterrupt, EOFError):
                 return 'exit'
@@ -420,13 +834,14 @@ Return ONLY the processed text content, without any additional commentary, expla
         print(f"Created blip: {blip_path}")
 
         # Initial edit
-        if not self.edit_file(blip_path):
+        content = self.edit_file(blip_path)
+        if content is None:
             print("No changes made. Canceling...")
             blip_path.unlink()
             return
 
         # Add initial version to stack
-        self.version_stack.push(blip_path.read_text())
+        self.version_stack.push(content)
 
         # Main menu loop
         while True:
@@ -434,12 +849,15 @@ Return ONLY the processed text content, without any additional commentary, expla
 
             if choice == 'copyread':  # Copyread
                 self.copyread_blip(blip_path)
+            elif choice == 'copyread_all':  # Copyread (All Prompts)
+                self.copyread_blip_all(blip_path)
             elif choice == 'custom_ai':  # Prompt Changes (GPT)
                 self.custom_ai_processing(blip_path)
             elif choice == 'edit':  # Edit manually
-                if self.edit_file(blip_path):
+                content = self.edit_file(blip_path)
+                if content is not None:
                     # User made changes, add to stack
-                    self.version_stack.push(blip_path.read_text())
+                    self.version_stack.push(content)
             elif choice == 'publish':  # Publish
                 if self.deploy_blip():
                     print("Blog deployed successfully!")
@@ -456,6 +874,14 @@ def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Create and edit Hugo blip posts")
     parser.add_argument("project_root", help="Path to project root directory")
+    parser.add_argument("--no-edit", action="store_true",
+                        help="Don't open the editor after AI passes; use \"Edit manually\" when done")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse rewrites of unchanged text cached by earlier --cache runs (kept 30 days)")
+    parser.add_argument("--batch", nargs="+", metavar="BLIP",
+                        help="Copyread existing blips through the OpenAI Batch API instead of creating a new one")
+    parser.add_argument("--prompt", default="copyread",
+                        help="Prompt to use with --batch (name of a file in prompts/, default: copyread)")
     args = parser.parse_args()
 
     project_root = Path(args.project_root).resolve()
@@ -463,8 +889,33 @@ def main():
         print(f"Error: Project root {project_root} does not exist.")
         sys.exit(1)
 
-    tool = BlipTool(project_root)
-    tool.run()
+    tool = BlipTool(project_root, auto_edit=not args.no_edit, use_cache=args.cache)
+
+    if args.batch:
+        if not tool.has_openai_key:
+            print("Error: --batch requires an OpenAI API key.")
+            sys.exit(1)
+
+        prompt_file = tool.prompts_dir / f"{args.prompt}.txt"
+        if not prompt_file.exists():
+            print(f"Error: Prompt {prompt_file} does not exist.")
+            sys.exit(1)
+
+        # Relative paths are taken from the project root; create_blip.sh runs us from tooling/blips
+        blip_paths = [(project_root / p).resolve() for p in args.batch]
+        missing = [p for p in blip_paths if not p.exists()]
+        if missing:
+            print(f"Error: Blip {missing[0]} does not exist.")
+            sys.exit(1)
+
+    try:
+        if args.batch:
+            updated = tool.submit_batch(blip_paths, tool.read_prompt(prompt_file))
+            print(f"Updated {updated} of {len(blip_paths)} blips.")
+        else:
+            tool.run()
+    finally:
+        tool.close()
 
 
 if __name__ == "__main__":
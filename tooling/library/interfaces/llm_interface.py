@@ -1,7 +1,8 @@
 """Interface for LLM services."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Union
 from models.book import Book
 
 
@@ -9,11 +10,11 @@ class LLMInterface(ABC):
     """Abstract interface for LLM services."""
 
     @abstractmethod
-    async def generate_cover_svg(self, cover_image_path: str, book: Book) -> str:
+    async def generate_cover_svg(self, cover_image_path: Union[str, bytes], book: Book) -> str:
         """Generate a 236x327px cover SVG based on the original cover.
 
         Args:
-            cover_image_path: Path to the original cover image
+            cover_image_path: Path to the original cover image, or its raw bytes
             book: Book metadata
 
         Returns:
@@ -22,11 +23,11 @@ class LLMInterface(ABC):
         pass
 
     @abstractmethod
-    async def generate_banner_svg(self, cover_image_path: str, book: Book, cover_svg: str) -> str:
+    async def generate_banner_svg(self, cover_image_path: Union[str, bytes], book: Book, cover_svg: str) -> str:
         """Generate a 1024x200px banner SVG based on the original cover and stylized SVG cover.
 
         Args:
-            cover_image_path: Path to the original cover image
+            cover_image_path: Path to the original cover image, or its raw bytes
             book: Book metadata
             cover_svg: The generated SVG cover code for consistency
 
@@ -71,3 +72,58 @@ class LLMInterface(ABC):
             URL to generated cover image or None if failed
         """
         pass
+
+    def svg_cache_key(self, batch: bool = False) -> str:
+        """Identify the provider model and settings that shape generated SVGs.
+
+        Cached SVGs are keyed on this, so services should include every
+        model id and setting whose change would produce different SVGs.
+
+        Args:
+            batch: Whether the SVGs come from generate_*_svgs_batch, which may use other settings
+
+        Returns:
+            Cache key component for this service
+        """
+        return type(self).__name__
+
+    async def generate_cover_svgs_batch(self, cover_image_path: Optional[Union[str, bytes]], book: Book,
+                                        count: int) -> List[Optional[str]]:
+        """Generate several cover SVGs for the same book in one go.
+
+        Services with a batch API override this; the default issues the
+        individual calls concurrently.
+
+        Args:
+            cover_image_path: Path to the original cover image, its raw bytes, or None for direct mode
+            book: Book metadata
+            count: Number of cover SVGs to generate
+
+        Returns:
+            SVG code per request, None where a request failed
+        """
+        if cover_image_path is None:
+            calls = [self.generate_cover_svg_direct(book) for _ in range(count)]
+        else:
+            calls = [self.generate_cover_svg(cover_image_path, book) for _ in range(count)]
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        return [None if isinstance(result, BaseException) else result for result in results]
+
+    async def generate_banner_svgs_batch(self, cover_image_path: Optional[Union[str, bytes]], book: Book,
+                                         cover_svgs: List[str]) -> List[Optional[str]]:
+        """Generate one banner SVG per cover SVG in one go.
+
+        Args:
+            cover_image_path: Path to the original cover image, its raw bytes, or None for direct mode
+            book: Book metadata
+            cover_svgs: Generated SVG covers, one banner is produced for each
+
+        Returns:
+            SVG code per request, None where a request failed
+        """
+        if cover_image_path is None:
+            calls = [self.generate_banner_svg_direct(book, svg) for svg in cover_svgs]
+        else:
+            calls = [self.generate_banner_svg(cover_image_path, book, svg) for svg in cover_svgs]
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        return [None if isinstance(result, BaseException) else result for result in results]
@@ -8,58 +8,294 @@ Takes an ISBN as input and creates themed SVG images using multimodal LLMs.
 
 import argparse
 import asyncio
+import hashlib
 import json
+import logging
+import logging.handlers
 import os
-import secrets
+import queue
 import subprocess
 import sys
 import tempfile
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Awaitable, Callable, List, Optional, Dict, Union
 
-import aiohttp
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from services.content_lookup import ContentLookupService
 from services.cover_lookup import CoverLookupService
+from services.http_client import close_session, http_get
 from services.llm_service import LLMService
+from services.rate_limiter import RateLimiter
 from services.simple_overflow_fixer import SimpleOverflowFixer
 from models.book import Book
+from interfaces.llm_interface import LLMInterface
 
 # Add parent directory to path to import shared utilities
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.config import config_manager
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _get_llm_service(model: str) -> LLMInterface:
+    """Return a shared LLM service instance for the model, creating it on first use."""
+    return LLMService.create(model)
+
+
+@lru_cache(maxsize=None)
+def _get_llm_semaphore(model: str) -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent requests to a model.
+
+    The limit defaults to 4 and can be overridden per model via
+    <MODEL>_CONCURRENCY (e.g. GPT_5_CONCURRENCY, CLAUDE_CONCURRENCY).
+    """
+    env_var = f"{model.upper().replace('-', '_')}_CONCURRENCY"
+    return asyncio.Semaphore(int(os.environ.get(env_var, 4)))
+
+
+@lru_cache(maxsize=None)
+def _get_llm_rate_limiter(model: str) -> RateLimiter:
+    """Return the limiter capping requests per minute to a model.
+
+    Unlimited by default; set <MODEL>_QPM (e.g. GPT_5_QPM=500) to match the
+    account's rate-limit tier.
+    """
+    env_var = f"{model.upper().replace('-', '_')}_QPM"
+    return RateLimiter(float(os.environ.get(env_var, 0)))
+
+
+MAX_PARALLEL_GENERATIONS = 8
+
+BOOK_CACHE_DIR = Path.home() / ".cache" / "carinthia" / "isbn"
+BOOK_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days in seconds
+
+SVG_CACHE_DIR = Path.home() / ".cache" / "carinthia" / "svg"
+SVG_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days in seconds
+GENERATED_COVER_CACHE_DIR = Path.home() / ".cache" / "carinthia" / "covers"
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+
+async def lookup_book_cached(content_service: ContentLookupService, isbn: str,
+                             refresh: bool = False) -> Optional[Book]:
+    """Look up book metadata, reusing a recent on-disk result for the same ISBN.
+
+    With refresh, the cached entry is ignored and replaced by a fresh lookup.
+    """
+    cache_path = BOOK_CACHE_DIR / f"{isbn}.json"
+
+    if not refresh:
+        try:
+            if time.time() - cache_path.stat().st_mtime < BOOK_CACHE_TTL:
+                logger.info("Using cached book metadata (--refresh-metadata looks it up again)")
+                return Book.from_dict(json.loads(cache_path.read_text()))
+        except (OSError, ValueError, KeyError):
+            pass
+
+    book = await content_service.lookup(isbn)
+
+    if book:
+        try:
+            # Write atomically so an interrupted run never leaves a partial entry
+            BOOK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=BOOK_CACHE_DIR, suffix='.tmp')
+            with open(temp_fd, 'w') as f:
+                json.dump(book.to_dict(), f)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not cache book metadata: %s", e)
+
+    return book
+
+
+@lru_cache(maxsize=None)
+def _prompts_digest() -> bytes:
+    """Digest of all prompt templates, so editing a template invalidates cached SVGs."""
+    digest = hashlib.sha256()
+    for template_path in sorted(PROMPTS_DIR.glob("*.txt")):
+        digest.update(template_path.name.encode())
+        digest.update(template_path.read_bytes())
+    return digest.digest()
+
+
+def svg_cache_seed(book: Book, cover_image: Optional[Union[str, bytes]]) -> str:
+    """Hash the inputs every generation for this book shares: prompts, metadata and cover."""
+    digest = hashlib.sha256(_prompts_digest())
+    digest.update(json.dumps(book.to_dict(), sort_keys=True).encode())
+    if cover_image is None:
+        digest.update(b"direct")
+    elif isinstance(cover_image, bytes):
+        digest.update(cover_image)
+    else:
+        digest.update(Path(cover_image).read_bytes())
+    return digest.hexdigest()
+
+
+def _svg_cache_path(cache_seed: str, service_key: str, generation_id: int, kind: str) -> Path:
+    """Return the cache file for one SVG of one generation slot.
+
+    service_key is the service's svg_cache_key(), naming the provider model
+    and settings, so switching either does not return stale SVGs.
+    """
+    key = hashlib.sha256(f"{cache_seed}:{service_key}:{generation_id}:{kind}".encode()).hexdigest()
+    return SVG_CACHE_DIR / f"{key}.svg"
+
+
+def _read_cache_file(cache_path: Path) -> Optional[bytes]:
+    """Read a cache entry younger than SVG_CACHE_TTL, or return None."""
+    try:
+        if time.time() - cache_path.stat().st_mtime < SVG_CACHE_TTL:
+            return cache_path.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def _write_cache_file(cache_path: Path, data: bytes) -> None:
+    """Store a cache entry atomically, ignoring cache write failures."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        with open(temp_fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Could not write cache entry: {e}")
+
+
+def _read_svg_cache(cache_path: Path) -> Optional[str]:
+    """Read a cached SVG, or return None if there is no fresh one."""
+    data = _read_cache_file(cache_path)
+    return data.decode() if data is not None else None
+
+
+def _write_svg_cache(cache_path: Path, svg: str) -> None:
+    """Store a generated SVG in the cache."""
+    _write_cache_file(cache_path, svg.encode())
+
+
+async def _generate_cached_batch(cache_paths: List[Optional[Path]],
+                                 generate: Callable[[List[int]], Awaitable[List[Optional[str]]]]
+                                 ) -> List[Optional[str]]:
+    """Batch counterpart of _generate_cached.
+
+    Only the indices without a usable cache entry are passed to generate,
+    which returns one SVG (or None on failure) per index.
+    """
+    svgs: List[Optional[str]] = list(await asyncio.gather(*[
+        asyncio.to_thread(_read_svg_cache, path) if path else asyncio.sleep(0)
+        for path in cache_paths
+    ]))
+    cached = sum(svg is not None for svg in svgs)
+    if cached:
+        print(f"Using {cached} cached SVGs")
+
+    missing = [i for i, svg in enumerate(svgs) if svg is None]
+    if missing:
+        generated = await generate(missing)
+        writes = []
+        for i, svg in zip(missing, generated):
+            svgs[i] = svg
+            if svg is not None and cache_paths[i] is not None:
+                writes.append(asyncio.to_thread(_write_svg_cache, cache_paths[i], svg))
+        await asyncio.gather(*writes)
+
+    return svgs
+
+
+async def _generate_cached(cache_path: Optional[Path],
+                           generate: Callable[[], Awaitable[str]]) -> str:
+    """Return the cached SVG at cache_path, or generate and cache it.
+
+    A cache_path of None disables caching.
+    """
+    if cache_path is None:
+        return await generate()
+
+    svg = await asyncio.to_thread(_read_svg_cache, cache_path)
+    if svg is not None:
+        print(f"Using cached SVG {cache_path.name}")
+        return svg
+
+    svg = await generate()
+    await asyncio.to_thread(_write_svg_cache, cache_path, svg)
+    return svg
+
+
+async def generate_and_download_cover_cached(book: Book, models: List[str]) -> Optional[bytes]:
+    """Generate a cover image, reusing one generated earlier for the same book and prompts."""
+    digest = hashlib.sha256(_prompts_digest())
+    digest.update(json.dumps(book.to_dict(), sort_keys=True).encode())
+    digest.update(",".join(models).encode())
+    cache_path = GENERATED_COVER_CACHE_DIR / f"{digest.hexdigest()}.img"
+
+    cover = await asyncio.to_thread(_read_cache_file, cache_path)
+    if cover is not None:
+        print("Using cached generated cover image")
+        return cover
+
+    cover = await generate_and_download_cover(book, models)
+    if cover:
+        await asyncio.to_thread(_write_cache_file, cache_path, cover)
+    return cover
+
+
+def _print_json(data: Dict) -> None:
+    """Print data as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is None:
+        # Match orjson: non-ASCII characters are written as-is, not \u-escaped
+        output = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        output = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    # Flush pending text output so it stays ordered before the raw bytes
+    sys.stdout.flush()
+    sys.stdout.buffer.write(output + b'\n')
+    sys.stdout.buffer.flush()
+
 
 def group_files_by_pairs(generated_files: List[str]) -> Dict:
     """Group generated SVG files by their hash prefix to create cover/banner pairs."""
     pairs = {}
 
     for filename in generated_files:
-        # Extract hash from filename (format: hash_isbn_type[_model]_timestamp.svg)
+        # Parse filename in one pass (format: hash_isbn_type[_model]_timestamp.svg)
         # The hash is always the first part before the first underscore
-        if '_' in filename:
-            hash_prefix = filename.split('_')[0]
-
-            # Determine if this is a cover or banner
-            if '_cover' in filename:
-                file_type = 'cover'
-            elif '_banner' in filename:
-                file_type = 'banner'
-            else:
-                continue
+        hash_prefix, sep, rest = filename.partition('_')
+        if not sep:
+            continue
 
-            # Initialize pair if not exists
-            if hash_prefix not in pairs:
-                pairs[hash_prefix] = {
-                    'hash': hash_prefix,
-                    'cover': None,
-                    'banner': None
-                }
+        # The type token always follows the ISBN
+        parts = rest.split('_', 2)
+        if len(parts) < 2:
+            continue
+        file_type = parts[1]
+        if file_type not in ('cover', 'banner'):
+            continue
+
+        # Initialize pair if not exists
+        if hash_prefix not in pairs:
+            pairs[hash_prefix] = {
+                'hash': hash_prefix,
+                'cover': None,
+                'banner': None
+            }
 
-            # Store just the filename - files are in output_dir
-            pairs[hash_prefix][file_type] = filename
+        # Store just the filename - files are in output_dir
+        pairs[hash_prefix][file_type] = filename
 
     # Convert to list and filter out incomplete pairs
     paired_files = []
@@ -72,12 +308,12 @@ def group_files_by_pairs(generated_files: List[str]) -> Dict:
     }
 
 
-async def generate_and_download_cover(book: Book, models: List[str]) -> Optional[str]:
-    """Generate a cover image using LLM and download it to a temporary file."""
+async def generate_and_download_cover(book: Book, models: List[str]) -> Optional[bytes]:
+    """Generate a cover image using LLM and download it into memory."""
     # Try each model until one succeeds in generating an image
     for model in models:
         try:
-            llm_service = LLMService.create(model)
+            llm_service = _get_llm_service(model)
             print(f"Generating cover image using {model}...")
 
             # Generate cover image URL
@@ -88,24 +324,18 @@ async def generate_and_download_cover(book: Book, models: List[str]) -> Optional
 
             print(f"Downloading generated cover from {model}...")
 
-            # Download the generated image
-            async with aiohttp.ClientSession() as session:
-                async with session.get(cover_url) as response:
-                    if response.status == 200:
-                        # Create temporary file
-                        suffix = '.jpg'  # Most AI-generated images are JPEG
-                        temp_fd, temp_path = tempfile.mkstemp(suffix=suffix)
-
-                        # Write image data to temp file
-                        with open(temp_fd, 'wb') as f:
-                            async for chunk in response.content.iter_chunked(8192):
-                                f.write(chunk)
-
-                        print(f"AI cover downloaded to: {temp_path}")
-                        return temp_path
-                    else:
-                        print(f"Failed to download generated cover (status: {response.status})")
-                        continue
+            # Download the generated image, keeping it in memory for the LLM calls
+            async with http_get(cover_url) as response:
+                if response.status == 200:
+                    data = bytearray()
+                    async for chunk in response.content.iter_chunked(65536):
+                        data.extend(chunk)
+
+                    print(f"AI cover downloaded ({len(data)} bytes)")
+                    return bytes(data)
+                else:
+                    print(f"Failed to download generated cover (status: {response.status})")
+                    continue
 
         except Exception as e:
             print(f"Error generating cover with {model}: {e}")
@@ -115,92 +345,201 @@ async def generate_and_download_cover(book: Book, models: List[str]) -> Optional
     return None
 
 
-async def generate_svg_pair(book: Book, cover_path: str, models: List[str],
-                           overflow_fixer: SimpleOverflowFixer, generation_id: int, output_dir: str = ".") -> List[str]:
-    """Generate one complete set of SVG files for all specified models."""
-    # Generate unique timestamp and hash for this generation
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    random_hash = secrets.token_hex(2)
-
-    generated_files = []
-    llm_services = [LLMService.create(model) for model in models]
+def _write_file(path: str, data: str) -> None:
+    """Write text to a file (run via asyncio.to_thread to keep the loop free)."""
+    with open(path, 'w') as f:
+        f.write(data)
 
-    for i, llm_service in enumerate(llm_services):
-        model_suffix = f"_{models[i]}" if len(models) > 1 else ""
 
-        print(f"Generation {generation_id}: Generating images with {models[i]}...")
-
-        # Generate cover image (236x327px)
-        cover_svg = await llm_service.generate_cover_svg(cover_path, book)
-
-        # Apply minimal overflow fixes if needed
-        corrected_cover_svg = overflow_fixer.fix_overflow(cover_svg, 'cover')
-        cover_filename = f"{random_hash}_{book.isbn}_cover{model_suffix}_{timestamp}.svg"
-        cover_filepath = os.path.join(output_dir, cover_filename)
+async def _one_model(book: Book, cover_image: Optional[Union[str, bytes]], model: str,
+                     overflow_fixer: SimpleOverflowFixer, timestamp: str, file_prefix: str,
+                     generation_id: int, multi_model: bool, output_dir: str = ".",
+                     cache_seed: Optional[str] = None) -> List[str]:
+    """Generate a cover/banner pair with a single model.
 
-        with open(cover_filepath, 'w') as f:
-            f.write(corrected_cover_svg)
-        print(f"Generation {generation_id}: Generated {cover_filename}")
-        generated_files.append(cover_filename)
+    cover_image is a path to the cover or its raw bytes; None selects direct
+    (text-only) generation. With a cache_seed (--cache), SVGs already generated
+    for this slot are reused.
+    """
+    llm_service = _get_llm_service(model)
+    semaphore = _get_llm_semaphore(model)
+    rate_limiter = _get_llm_rate_limiter(model)
+    model_suffix = f"_{model}" if multi_model else ""
+    file_suffix = f"{model_suffix}_{timestamp}.svg"
+    mode_text = " (direct mode)" if cover_image is None else ""
+
+    print(f"Generation {generation_id}: Generating images with {model}{mode_text}...")
+
+    def cache_path(kind: str) -> Optional[Path]:
+        if cache_seed is None:
+            return None
+        return _svg_cache_path(cache_seed, llm_service.svg_cache_key(), generation_id, kind)
+
+    async def generate_cover() -> str:
+        async with semaphore:
+            await rate_limiter.acquire()
+            if cover_image is None:
+                return await llm_service.generate_cover_svg_direct(book)
+            return await llm_service.generate_cover_svg(cover_image, book)
+
+    # Generate cover image (236x327px)
+    cover_svg = await _generate_cached(cache_path("cover"), generate_cover)
+
+    # Apply minimal overflow fixes if needed
+    corrected_cover_svg = await overflow_fixer.afix_overflow(cover_svg, 'cover')
+    cover_filename = f"{file_prefix}_cover{file_suffix}"
+    cover_filepath = os.path.join(output_dir, cover_filename)
+
+    # Write the cover in the background while the banner is being generated
+    cover_write_task = asyncio.create_task(
+        asyncio.to_thread(_write_file, cover_filepath, corrected_cover_svg))
+
+    async def generate_banner() -> str:
+        async with semaphore:
+            await rate_limiter.acquire()
+            if cover_image is None:
+                return await llm_service.generate_banner_svg_direct(book, corrected_cover_svg)
+            return await llm_service.generate_banner_svg(cover_image, book, corrected_cover_svg)
 
+    try:
         # Generate banner image (1024x200px) based on corrected cover SVG
-        banner_svg = await llm_service.generate_banner_svg(cover_path, book, corrected_cover_svg)
+        banner_svg = await _generate_cached(cache_path("banner"), generate_banner)
 
         # Apply minimal overflow fixes if needed
-        corrected_banner_svg = overflow_fixer.fix_overflow(banner_svg, 'banner')
-        banner_filename = f"{random_hash}_{book.isbn}_banner{model_suffix}_{timestamp}.svg"
+        corrected_banner_svg = await overflow_fixer.afix_overflow(banner_svg, 'banner')
+        banner_filename = f"{file_prefix}_banner{file_suffix}"
         banner_filepath = os.path.join(output_dir, banner_filename)
 
-        with open(banner_filepath, 'w') as f:
-            f.write(corrected_banner_svg)
-        print(f"Generation {generation_id}: Generated {banner_filename}")
-        generated_files.append(banner_filename)
+        await asyncio.gather(cover_write_task,
+                             asyncio.to_thread(_write_file, banner_filepath, corrected_banner_svg))
+    except BaseException:
+        # A failed generation must not leave the cover write unawaited or its file behind
+        await asyncio.gather(cover_write_task, return_exceptions=True)
+        if os.path.exists(cover_filepath):
+            os.remove(cover_filepath)
+        raise
 
-    return generated_files
+    print(f"Generation {generation_id}: Generated {cover_filename}")
+    print(f"Generation {generation_id}: Generated {banner_filename}")
 
+    return [cover_filename, banner_filename]
 
-async def generate_svg_pair_direct(book: Book, models: List[str],
-                                  overflow_fixer: SimpleOverflowFixer, generation_id: int, output_dir: str = ".") -> List[str]:
-    """Generate one complete set of SVG files using direct text-only generation."""
-    # Generate unique timestamp and hash for this generation
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    random_hash = secrets.token_hex(2)
 
-    generated_files = []
-    llm_services = [LLMService.create(model) for model in models]
+async def generate_svg_pair(book: Book, cover_image: Optional[Union[str, bytes]], models: List[str],
+                           overflow_fixer: SimpleOverflowFixer, generation_id: int, random_hash: str,
+                           output_dir: str = ".", cache_seed: Optional[str] = None) -> List[str]:
+    """Generate one complete set of SVG files for all specified models."""
+    # Generate unique timestamp for this generation
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    file_prefix = f"{random_hash}_{book.isbn}"
 
-    for i, llm_service in enumerate(llm_services):
-        model_suffix = f"_{models[i]}" if len(models) > 1 else ""
+    # Models are independent of each other, so run them concurrently
+    results = await asyncio.gather(*[
+        _one_model(book, cover_image, model, overflow_fixer, timestamp, file_prefix,
+                   generation_id, len(models) > 1, output_dir, cache_seed)
+        for model in models
+    ])
+    return list(chain.from_iterable(results))
 
-        print(f"Generation {generation_id}: Generating images with {models[i]} (direct mode)...")
 
-        # Generate cover image (236x327px) directly from text
-        cover_svg = await llm_service.generate_cover_svg_direct(book)
+async def run_generations(book: Book, cover_image: Optional[Union[str, bytes]], models: List[str],
+                          overflow_fixer: SimpleOverflowFixer, hashes: List[str],
+                          output_dir: str = ".", cache_seed: Optional[str] = None) -> List[List[str]]:
+    """Run one generation per hash with bounded parallelism.
 
-        # Apply minimal overflow fixes if needed
-        corrected_cover_svg = overflow_fixer.fix_overflow(cover_svg, 'cover')
-        cover_filename = f"{random_hash}_{book.isbn}_cover{model_suffix}_{timestamp}.svg"
-        cover_filepath = os.path.join(output_dir, cover_filename)
+    A failing generation is reported and yields no files, leaving the
+    other generations (and the tokens they already spent) intact.
+    """
+    semaphore = asyncio.Semaphore(min(len(hashes), MAX_PARALLEL_GENERATIONS))
+
+    async def run_one(generation_id: int, random_hash: str) -> List[str]:
+        async with semaphore:
+            try:
+                return await generate_svg_pair(book, cover_image, models, overflow_fixer,
+                                               generation_id, random_hash, output_dir,
+                                               cache_seed)
+            except Exception as e:
+                print(f"Generation {generation_id}: Failed: {e}")
+                return []
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(run_one(i + 1, random_hash)) for i, random_hash in enumerate(hashes)]
+
+    return [task.result() for task in tasks]
+
+
+async def _batch_one_model(book: Book, cover_image: Optional[Union[str, bytes]], model: str,
+                           overflow_fixer: SimpleOverflowFixer, hashes: List[str], timestamp: str,
+                           multi_model: bool, output_dir: str = ".", cache_seed: Optional[str] = None) -> List[List[str]]:
+    """Generate all cover/banner pairs for one model as two provider batches."""
+    llm_service = _get_llm_service(model)
+    model_suffix = f"_{model}" if multi_model else ""
+    file_suffix = f"{model_suffix}_{timestamp}.svg"
+
+    def cache_paths(kind: str, indices: List[int]) -> List[Optional[Path]]:
+        if cache_seed is None:
+            return [None] * len(indices)
+        service_key = llm_service.svg_cache_key(batch=True)
+        return [_svg_cache_path(cache_seed, service_key, i + 1, kind) for i in indices]
+
+    async def generate_covers(missing: List[int]) -> List[Optional[str]]:
+        print(f"Submitting {len(missing)} cover requests to {model} as a batch...")
+        return await llm_service.generate_cover_svgs_batch(cover_image, book, len(missing))
+
+    all_indices = list(range(len(hashes)))
+    cover_svgs = await _generate_cached_batch(cache_paths("cover", all_indices), generate_covers)
+
+    # Only generations whose cover succeeded go on to the banner batch
+    succeeded = [i for i, svg in enumerate(cover_svgs) if svg is not None]
+    corrected_covers = await asyncio.gather(*[
+        overflow_fixer.afix_overflow(cover_svgs[i], 'cover') for i in succeeded
+    ])
+
+    async def generate_banners(missing: List[int]) -> List[Optional[str]]:
+        print(f"Submitting {len(missing)} banner requests to {model} as a batch...")
+        return await llm_service.generate_banner_svgs_batch(
+            cover_image, book, [corrected_covers[j] for j in missing])
+
+    banner_svgs = await _generate_cached_batch(cache_paths("banner", succeeded), generate_banners)
+    corrected_banners = await asyncio.gather(*[
+        overflow_fixer.afix_overflow(svg, 'banner') if svg is not None else asyncio.sleep(0)
+        for svg in banner_svgs
+    ])
+
+    files: List[List[str]] = [[] for _ in hashes]
+    writes = []
+    for i, cover_svg, banner_svg in zip(succeeded, corrected_covers, corrected_banners):
+        if banner_svg is None:
+            print(f"Generation {i + 1}: Failed to generate banner with {model}")
+            continue
 
-        with open(cover_filepath, 'w') as f:
-            f.write(corrected_cover_svg)
-        print(f"Generation {generation_id}: Generated {cover_filename}")
-        generated_files.append(cover_filename)
+        file_prefix = f"{hashes[i]}_{book.isbn}"
+        cover_filename = f"{file_prefix}_cover{file_suffix}"
+        banner_filename = f"{file_prefix}_banner{file_suffix}"
+        writes.append(asyncio.to_thread(_write_file, os.path.join(output_dir, cover_filename), cover_svg))
+        writes.append(asyncio.to_thread(_write_file, os.path.join(output_dir, banner_filename), banner_svg))
+        files[i] = [cover_filename, banner_filename]
 
-        # Generate banner image (1024x200px) based on corrected cover SVG only
-        banner_svg = await llm_service.generate_banner_svg_direct(book, corrected_cover_svg)
+    await asyncio.gather(*writes)
+    return files
 
-        # Apply minimal overflow fixes if needed
-        corrected_banner_svg = overflow_fixer.fix_overflow(banner_svg, 'banner')
-        banner_filename = f"{random_hash}_{book.isbn}_banner{model_suffix}_{timestamp}.svg"
-        banner_filepath = os.path.join(output_dir, banner_filename)
 
-        with open(banner_filepath, 'w') as f:
-            f.write(corrected_banner_svg)
-        print(f"Generation {generation_id}: Generated {banner_filename}")
-        generated_files.append(banner_filename)
+async def run_batch_generations(book: Book, cover_image: Optional[Union[str, bytes]], models: List[str],
+                                overflow_fixer: SimpleOverflowFixer, hashes: List[str],
+                                output_dir: str = ".", cache_seed: Optional[str] = None) -> List[List[str]]:
+    """Run all generations through the providers' batch APIs.
 
-    return generated_files
+    Batches trade latency for lower cost, so this suits large -n runs that
+    are not waited on interactively. Returns files grouped per generation,
+    like run_generations.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    per_model = await asyncio.gather(*[
+        _batch_one_model(book, cover_image, model, overflow_fixer, hashes, timestamp,
+                         len(models) > 1, output_dir, cache_seed)
+        for model in models
+    ])
+    return [list(chain.from_iterable(files)) for files in zip(*per_model)]
 
 
 async def create_hugo_post(book: Book, post_dir: str) -> None:
@@ -355,6 +694,27 @@ def launch_editor_for_post(post_path: str) -> None:
         print("")
 
 
+def normalize_isbn(isbn: str) -> str:
+    """Strip dashes and spaces from an ISBN and upper-case a trailing 'x'."""
+    return isbn.replace('-', '').replace(' ', '').upper()
+
+
+def is_valid_isbn(isbn: str) -> bool:
+    """Check the ISBN-10 (mod 11) or ISBN-13 (mod 10) checksum of a normalized ISBN."""
+    if len(isbn) == 10:
+        if not isbn[:9].isdigit() or not (isbn[9].isdigit() or isbn[9] == 'X'):
+            return False
+        digits = [int(c) for c in isbn[:9]] + [10 if isbn[9] == 'X' else int(isbn[9])]
+        return sum((10 - i) * d for i, d in enumerate(digits)) % 11 == 0
+
+    if len(isbn) == 13:
+        if not isbn.isdigit():
+            return False
+        return sum((3 if i % 2 else 1) * int(c) for i, c in enumerate(isbn)) % 10 == 0
+
+    return False
+
+
 def validate_api_keys(models: List[str], generate_cover: bool = False) -> None:
     """Validate that required API keys are available for the specified models and features.
 
@@ -422,6 +782,13 @@ async def main():
                        help='Use LLM-generated cover image instead of downloading original cover')
     parser.add_argument('-d', '--direct', action='store_true',
                        help='Generate SVGs directly from book description without any cover image')
+    parser.add_argument('-b', '--batch', action='store_true',
+                       help='Submit generations through the provider batch API (cheaper, slower)')
+    parser.add_argument('--cache', action='store_true',
+                       help='Reuse SVGs (and generated covers) cached by earlier --cache runs of this book '
+                            'instead of generating new ones')
+    parser.add_argument('--refresh-metadata', action='store_true',
+                       help='Look up book metadata again instead of using the cached result')
     parser.add_argument('-c', '--create', type=str, metavar='PATH',
                        help='Create post directory structure in the specified path')
     parser.add_argument('-e', '--edit', action='store_true',
@@ -432,9 +799,6 @@ async def main():
     if not args.model:
         args.model = ['gpt-5']
 
-    # Validate API keys early - before doing any work
-    validate_api_keys(args.model, args.generate_cover)
-
     # Validate conflicting flags
     if args.generate_cover and args.direct:
         print("Error: Cannot use both --generate-cover (-g) and --direct (-d) flags together")
@@ -444,6 +808,15 @@ async def main():
         print("Error: --edit (-e) requires --create (-c) flag")
         sys.exit(1)
 
+    # Normalize and validate ISBN before any lookups
+    args.isbn = normalize_isbn(args.isbn)
+    if not is_valid_isbn(args.isbn):
+        print(f"Error: '{args.isbn}' is not a valid ISBN-10 or ISBN-13")
+        sys.exit(1)
+
+    # Validate API keys early - before doing any work
+    validate_api_keys(args.model, args.generate_cover)
+
     # Handle --create parameter
     output_dir = "."  # Default to current directory
     if args.create:
@@ -452,11 +825,8 @@ async def main():
             print(f"Error: Directory '{args.create}' does not exist")
             sys.exit(1)
 
-        # Normalize ISBN by removing dashes
-        normalized_isbn = args.isbn.replace('-', '')
-
         # Create subdirectory with normalized ISBN
-        isbn_dir = os.path.join(args.create, normalized_isbn)
+        isbn_dir = os.path.join(args.create, args.isbn)
 
         # Check if directory already exists
         if os.path.exists(isbn_dir):
@@ -473,9 +843,13 @@ async def main():
         cover_service = CoverLookupService()
         overflow_fixer = SimpleOverflowFixer()
 
+        # Pre-generate the random hash that prefixes each generation's files
+        hashes = [os.urandom(2).hex() for _ in range(args.parallel)]
+        generate = run_batch_generations if args.batch else run_generations
+
         # Look up book metadata
         print(f"Looking up book metadata for ISBN: {args.isbn}")
-        book = await content_service.lookup(args.isbn)
+        book = await lookup_book_cached(content_service, args.isbn, refresh=args.refresh_metadata)
 
         if not book:
             print(f"Could not find book information for ISBN: {args.isbn}")
@@ -496,51 +870,43 @@ async def main():
             # Direct mode - generate SVGs from text only
             print("Using direct mode - generating SVGs from text only...")
 
-            # Create parallel generation tasks for direct mode
+            # Run parallel generations for direct mode
             print(f"Starting {args.parallel} parallel direct generations...")
-            tasks = []
-            for i in range(args.parallel):
-                task = generate_svg_pair_direct(book, args.model, overflow_fixer, i + 1, output_dir)
-                tasks.append(task)
-
-            # Run all generations in parallel
-            all_generated_files = await asyncio.gather(*tasks)
+            cache_seed = await asyncio.to_thread(svg_cache_seed, book, None) if args.cache else None
+            all_generated_files = await generate(book, None, args.model, overflow_fixer,
+                                                 hashes, output_dir, cache_seed)
 
         else:
             # Standard mode - use cover images
             # Get cover image - either download original or generate new one
             if args.generate_cover:
                 print("Generating cover image with LLM...")
-                cover_path = await generate_and_download_cover(book, args.model)
+                if args.cache:
+                    cover_image = await generate_and_download_cover_cached(book, args.model)
+                else:
+                    cover_image = await generate_and_download_cover(book, args.model)
             else:
                 print("Downloading original cover image...")
-                cover_path = await cover_service.download_cover(book)
+                cover_image = await cover_service.download_cover(book)
 
-            if not cover_path:
+            if not cover_image:
                 action = "generate" if args.generate_cover else "download"
                 print(f"Could not {action} cover image")
                 sys.exit(1)
 
-            # Create parallel generation tasks
+            # Run parallel generations
             print(f"Starting {args.parallel} parallel generations...")
-            tasks = []
-            for i in range(args.parallel):
-                task = generate_svg_pair(book, cover_path, args.model, overflow_fixer, i + 1, output_dir)
-                tasks.append(task)
-
-            # Run all generations in parallel
-            all_generated_files = await asyncio.gather(*tasks)
+            cache_seed = await asyncio.to_thread(svg_cache_seed, book, cover_image) if args.cache else None
+            all_generated_files = await generate(book, cover_image, args.model, overflow_fixer,
+                                                 hashes, output_dir, cache_seed)
 
-            # Clean up temporary cover file (whether downloaded or generated)
-            if cover_path and Path(cover_path).exists():
-                Path(cover_path).unlink()
-                action = "Generated" if args.generate_cover else "Downloaded"
-                print(f"{action} cover file cleaned up")
+            # Clean up temporary cover file (generated covers stay in memory)
+            if isinstance(cover_image, str) and Path(cover_image).exists():
+                Path(cover_image).unlink()
+                print("Downloaded cover file cleaned up")
 
         # Flatten the list of lists
-        generated_files = []
-        for file_list in all_generated_files:
-            generated_files.extend(file_list)
+        generated_files = list(chain.from_iterable(all_generated_files))
 
         mode_text = "direct " if args.direct else ""
         print(f"\nCompleted {args.parallel} {mode_text}generations:")
@@ -549,11 +915,11 @@ async def main():
 
         # Output book metadata as JSON
         book_json = book.to_dict()
-        print(json.dumps(book_json, indent=2))
+        _print_json(book_json)
 
         # Output paired SVG files as second JSON
         paired_files_json = group_files_by_pairs(generated_files)
-        print(json.dumps(paired_files_json, indent=2))
+        _print_json(paired_files_json)
 
         # Handle image selection and cleanup if in creation mode
         if args.create:
@@ -562,7 +928,40 @@ async def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        await close_session()
+
+
+def _start_logging() -> logging.handlers.QueueListener:
+    """Route service logs through a queue so stderr writes happen off the event loop."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    # Progress messages from this script and our own services; third-party libraries stay at WARNING
+    logging.getLogger('services').setLevel(logging.INFO)
+    logger.setLevel(logging.INFO)
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+def run() -> None:
+    """Run main() on a fresh event loop with eager task execution where available."""
+    listener = _start_logging()
+    try:
+        # Prefer uvloop's faster event loop when it is installed; the Runner still
+        # cancels leftover tasks and shuts down async generators and the default executor
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+            # Eager tasks (Python 3.12+) run synchronously until their first real suspension
+            if hasattr(asyncio, 'eager_task_factory'):
+                runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            runner.run(main())
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -24,3 +24,15 @@ class Book:
             'pages': self.pages,
             'description': self.description
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Book':
+        """Create a book from a dictionary produced by to_dict()."""
+        return cls(
+            isbn=data['isbn'],
+            title=data['title'],
+            author=data['author'],
+            publication_year=data.get('publication_year'),
+            pages=data.get('pages'),
+            description=data.get('description')
+        )
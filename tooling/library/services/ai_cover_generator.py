@@ -1,13 +1,15 @@
 """AI-generated cover service as fallback."""
 
-import aiohttp
+import logging
 import tempfile
-import base64
 from typing import Optional
 from interfaces.cover_lookup import CoverLookupInterface
 from interfaces.llm_interface import LLMInterface
+from services.http_client import http_get
 from models.book import Book
 
+logger = logging.getLogger(__name__)
+
 
 class AICoverGeneratorService(CoverLookupInterface):
     """AI-powered cover generator service as fallback when no cover is found."""
@@ -28,19 +30,18 @@ class AICoverGeneratorService(CoverLookupInterface):
                 return None
 
             # Download the generated image
-            async with aiohttp.ClientSession() as session:
-                async with session.get(image_url) as response:
-                    if response.status != 200:
-                        return None
-
-                    # Create temporary file
-                    suffix = '.png'  # AI-generated images are typically PNG
-                    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
-                        content = await response.read()
-                        tmp_file.write(content)
-                        print(f"AI cover downloaded to: {tmp_file.name}")
-                        return tmp_file.name
+            async with http_get(image_url) as response:
+                if response.status != 200:
+                    return None
+
+                # Create temporary file
+                suffix = '.png'  # AI-generated images are typically PNG
+                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        tmp_file.write(chunk)
+                    logger.info("AI cover downloaded to: %s", tmp_file.name)
+                    return tmp_file.name
 
         except Exception as e:
-            print(f"Error generating AI cover: {e}")
+            logger.warning("Error generating AI cover: %s", e)
             return None
@@ -1,18 +1,81 @@
 """Anthropic Claude service implementation."""
 
-import base64
+import asyncio
+import logging
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 import anthropic
 from interfaces.llm_interface import LLMInterface
 from models.book import Book
+from services.image_utils import shrink_image
+from services.prompt_templates import render_template
+
+# Prefer the SIMD-accelerated encoder when it is installed
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Optional ```svg / ``` fences around the payload, with surrounding whitespace
+_SVG_FENCE_RE = re.compile(r'\s*(?:```(?:svg)?)?\s*(.*?)\s*(?:```)?\s*\Z', re.DOTALL)
+
+# Models for requests with the cover image attached and for text-only (direct) requests
+IMAGE_MODEL = "claude-sonnet-4-0"
+TEXT_MODEL = "claude-3-5-sonnet-20241022"
+
+# Seconds between status checks while a Message Batch is processing
+BATCH_POLL_INTERVAL = 30
 
 # Add parent directory to path to import shared utilities
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from shared.config import config_manager
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _read_prompt_template(template_name: str) -> str:
+    """Read a prompt template from disk once per process."""
+    template_path = Path(__file__).parent.parent / "prompts" / template_name
+    return template_path.read_text().strip()
+
+
+def _sniff_media_type(raw: bytes) -> str:
+    """Detect the image media type from its leading magic bytes."""
+    if raw.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if raw.startswith((b'GIF87a', b'GIF89a')):
+        return 'image/gif'
+    if raw[:4] == b'RIFF' and raw[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'
+
+
+@lru_cache(maxsize=8)
+def _encode_image_cached(image: Union[str, bytes], mtime_ns: Optional[int]) -> tuple[str, str]:
+    """Encode an image once and share the result across all cover and banner calls."""
+    if isinstance(image, bytes):
+        raw = image
+    else:
+        with open(image, "rb") as image_file:
+            raw = image_file.read()
+
+    # Fewer pixels means fewer vision tokens and a smaller request
+    raw = shrink_image(raw)
+
+    # Sniff the real format, since temp file suffixes are only a guess
+    return base64.b64encode(raw).decode('ascii'), _sniff_media_type(raw)
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return one client per API key so every instance shares its connection pool."""
+    return anthropic.AsyncAnthropic(api_key=api_key)
+
 
 class ClaudeService(LLMInterface):
     """Anthropic Claude service for generating SVGs."""
@@ -22,28 +85,17 @@ class ClaudeService(LLMInterface):
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY is required (set environment variable or add to ~/.config/carinthia/config.json)")
 
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self.client = _get_client(api_key)
 
     def _load_prompt_template(self, template_name: str) -> str:
         """Load prompt template from file."""
-        template_path = Path(__file__).parent.parent / "prompts" / template_name
-        return template_path.read_text().strip()
-
-    def _encode_image(self, image_path: str) -> tuple[str, str]:
-        """Encode image to base64 string and detect media type."""
-        with open(image_path, "rb") as image_file:
-            image_data = base64.b64encode(image_file.read()).decode('utf-8')
+        return _read_prompt_template(template_name)
 
-        # Determine media type from file extension
-        extension = Path(image_path).suffix.lower()
-        media_type = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.webp': 'image/webp'
-        }.get(extension, 'image/jpeg')
-
-        return image_data, media_type
+    def _encode_image(self, image: Union[str, bytes]) -> tuple[str, str]:
+        """Encode image (file path or raw bytes) to base64 string and detect media type."""
+        # Key file paths on their mtime so a replaced file is re-encoded
+        mtime_ns = None if isinstance(image, bytes) else os.stat(image).st_mtime_ns
+        return _encode_image_cached(image, mtime_ns)
 
     def _format_prompt(self, template: str, book: Book, cover_svg: str = None) -> str:
         """Format prompt template with book information."""
@@ -57,38 +109,26 @@ class ClaudeService(LLMInterface):
         if cover_svg is not None:
             format_dict['cover_svg'] = cover_svg
 
-        return template.format(**format_dict)
+        return render_template(template, format_dict)
 
     def _clean_svg_output(self, response: str) -> str:
         """Clean SVG output by removing markdown code markers and extra whitespace."""
-        # Remove markdown code block markers
-        response = response.strip()
-
-        # Remove ```svg at the beginning
-        if response.startswith('```svg'):
-            response = response[6:].strip()
-        elif response.startswith('```'):
-            response = response[3:].strip()
+        return _SVG_FENCE_RE.match(response).group(1)
 
-        # Remove ``` at the end
-        if response.endswith('```'):
-            response = response[:-3].strip()
-
-        return response
-
-    async def generate_cover_svg(self, cover_image_path: str, book: Book) -> str:
-        """Generate a 236x327px cover SVG based on the original cover."""
-        template = self._load_prompt_template("cover_svg_prompt.txt")
-        prompt = self._format_prompt(template, book)
+    def svg_cache_key(self, batch: bool = False) -> str:
+        """Identify the models and settings that shape generated SVGs."""
+        return f"{IMAGE_MODEL}:{TEXT_MODEL}"
 
+    def _image_request(self, cover_image_path: Union[str, bytes], prompt: str) -> dict:
+        """Build messages.create parameters for a prompt with the cover image attached."""
         # Encode the cover image
         base64_image, media_type = self._encode_image(cover_image_path)
 
-        message = await self.client.messages.create(
-            model="claude-sonnet-4-0",
-            max_tokens=16000,
-            temperature=0.7,
-            messages=[
+        return {
+            "model": IMAGE_MODEL,
+            "max_tokens": 16000,
+            "temperature": 0.7,
+            "messages": [
                 {
                     "role": "user",
                     "content": [
@@ -107,84 +147,102 @@ class ClaudeService(LLMInterface):
                     ]
                 }
             ]
-        )
-
-        return self._clean_svg_output(message.content[0].text)
-
-    async def generate_banner_svg(self, cover_image_path: str, book: Book, cover_svg: str) -> str:
-        """Generate a 1024x200px banner SVG based on the original cover and stylized SVG cover."""
-        template = self._load_prompt_template("banner_svg_prompt.txt")
-        prompt = self._format_prompt(template, book, cover_svg)
-
-        # Encode the cover image
-        base64_image, media_type = self._encode_image(cover_image_path)
+        }
 
-        message = await self.client.messages.create(
-            model="claude-sonnet-4-0",
-            max_tokens=16000,
-            temperature=0.7,
-            messages=[
+    def _text_request(self, prompt: str) -> dict:
+        """Build messages.create parameters for a text-only prompt."""
+        return {
+            "model": TEXT_MODEL,
+            "max_tokens": 4000,
+            "temperature": 0.7,
+            "messages": [
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": base64_image
-                            }
-                        },
-                        {
-                            "type": "text",
-                            "text": prompt
-                        }
-                    ]
+                    "content": prompt
                 }
             ]
-        )
+        }
+
+    def _cover_request(self, cover_image_path: Optional[Union[str, bytes]], book: Book) -> dict:
+        """Build request parameters for a cover SVG; no image selects direct mode."""
+        if cover_image_path is None:
+            template = self._load_prompt_template("direct_cover_svg_prompt.txt")
+            return self._text_request(self._format_prompt(template, book))
+
+        template = self._load_prompt_template("cover_svg_prompt.txt")
+        return self._image_request(cover_image_path, self._format_prompt(template, book))
+
+    def _banner_request(self, cover_image_path: Optional[Union[str, bytes]], book: Book, cover_svg: str) -> dict:
+        """Build request parameters for a banner SVG; no image selects direct mode."""
+        if cover_image_path is None:
+            template = self._load_prompt_template("direct_banner_svg_prompt.txt")
+            return self._text_request(self._format_prompt(template, book, cover_svg))
+
+        template = self._load_prompt_template("banner_svg_prompt.txt")
+        return self._image_request(cover_image_path, self._format_prompt(template, book, cover_svg))
 
+    async def generate_cover_svg(self, cover_image_path: Union[str, bytes], book: Book) -> str:
+        """Generate a 236x327px cover SVG based on the original cover."""
+        message = await self.client.messages.create(**self._cover_request(cover_image_path, book))
+        return self._clean_svg_output(message.content[0].text)
+
+    async def generate_banner_svg(self, cover_image_path: Union[str, bytes], book: Book, cover_svg: str) -> str:
+        """Generate a 1024x200px banner SVG based on the original cover and stylized SVG cover."""
+        message = await self.client.messages.create(**self._banner_request(cover_image_path, book, cover_svg))
         return self._clean_svg_output(message.content[0].text)
 
     async def generate_cover_svg_direct(self, book: Book) -> str:
         """Generate a 236x327px cover SVG based solely on book text information."""
-        template = self._load_prompt_template("direct_cover_svg_prompt.txt")
-        prompt = self._format_prompt(template, book)
-
-        message = await self.client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=4000,
-            temperature=0.7,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-
+        message = await self.client.messages.create(**self._cover_request(None, book))
         return self._clean_svg_output(message.content[0].text)
 
     async def generate_banner_svg_direct(self, book: Book, cover_svg: str) -> str:
         """Generate a 1024x200px banner SVG based solely on the stylized SVG cover."""
-        template = self._load_prompt_template("direct_banner_svg_prompt.txt")
-        prompt = self._format_prompt(template, book, cover_svg)
-
-        message = await self.client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=4000,
-            temperature=0.7,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-
+        message = await self.client.messages.create(**self._banner_request(None, book, cover_svg))
         return self._clean_svg_output(message.content[0].text)
 
+    async def _run_batch(self, requests: List[dict]) -> List[Optional[str]]:
+        """Run requests through the Message Batches API and return cleaned SVGs in order.
+
+        Requests that did not succeed yield None.
+        """
+        if not requests:
+            return []
+
+        batch = await self.client.messages.batches.create(requests=[
+            {"custom_id": f"request-{i}", "params": params}
+            for i, params in enumerate(requests)
+        ])
+        logger.info("Submitted Claude batch %s with %s requests", batch.id, len(requests))
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        svgs: List[Optional[str]] = [None] * len(requests)
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                index = int(entry.custom_id.rsplit('-', 1)[1])
+                svgs[index] = self._clean_svg_output(entry.result.message.content[0].text)
+            else:
+                logger.warning("Claude batch request %s %s", entry.custom_id, entry.result.type)
+
+        return svgs
+
+    async def generate_cover_svgs_batch(self, cover_image_path: Optional[Union[str, bytes]], book: Book,
+                                        count: int) -> List[Optional[str]]:
+        """Generate several cover SVGs in one Message Batch."""
+        request = self._cover_request(cover_image_path, book)
+        return await self._run_batch([request] * count)
+
+    async def generate_banner_svgs_batch(self, cover_image_path: Optional[Union[str, bytes]], book: Book,
+                                         cover_svgs: List[str]) -> List[Optional[str]]:
+        """Generate one banner SVG per cover SVG in one Message Batch."""
+        return await self._run_batch([
+            self._banner_request(cover_image_path, book, cover_svg) for cover_svg in cover_svgs
+        ])
+
     async def generate_cover_image(self, book: Book) -> Optional[str]:
         """Claude cannot generate images, so this returns None."""
-        print("Claude does not support image generation. Skipping cover image generation.")
+        logger.warning("Claude does not support image generation. Skipping cover image generation.")
         return None
@@ -1,14 +1,18 @@
-"""Content lookup service that tries multiple sources."""
+"""Content lookup service that queries multiple sources."""
 
+import asyncio
+import logging
 from typing import Optional, List
 from interfaces.content_lookup import ContentLookupInterface
 from services.google_books import GoogleBooksService
 from services.goodreads_scraper import GoodreadsScraperService
 from models.book import Book
 
+logger = logging.getLogger(__name__)
+
 
 class ContentLookupService:
-    """Service that tries multiple content lookup sources in order."""
+    """Service that queries multiple content lookup sources concurrently."""
 
     def __init__(self):
         self.services: List[ContentLookupInterface] = [
@@ -16,22 +20,42 @@ class ContentLookupService:
             GoodreadsScraperService()
         ]
 
+    async def _lookup_one(self, service: ContentLookupInterface, isbn: str) -> Optional[Book]:
+        """Look up a book with one service, reporting errors instead of raising."""
+        try:
+            return await service.lookup_by_isbn(isbn)
+        except Exception as e:
+            logger.warning("Error with %s: %s", service.__class__.__name__, e)
+            return None
+
     async def lookup(self, isbn: str) -> Optional[Book]:
-        """Look up book metadata trying each service and merging results."""
+        """Look up book metadata querying all services concurrently and merging results."""
         google_books_result = None
         goodreads_result = None
 
-        for service in self.services:
-            try:
-                book = await service.lookup_by_isbn(isbn)
-                if book:
-                    if isinstance(service, GoogleBooksService):
-                        google_books_result = book
-                    elif isinstance(service, GoodreadsScraperService):
-                        goodreads_result = book
-            except Exception as e:
-                print(f"Error with {service.__class__.__name__}: {e}")
-                continue
+        tasks = {
+            asyncio.create_task(self._lookup_one(service, isbn)): service
+            for service in self.services
+        }
+        pending = set(tasks)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                book = task.result()
+                if not book:
+                    continue
+                service = tasks[task]
+                if isinstance(service, GoogleBooksService):
+                    google_books_result = book
+                elif isinstance(service, GoodreadsScraperService):
+                    goodreads_result = book
+
+            # A complete Google Books result needs nothing from the other sources
+            if google_books_result and google_books_result.pages and google_books_result.description:
+                for task in pending:
+                    task.cancel()
+                break
 
         # Merge results, prioritizing Google Books but filling missing data from Goodreads
         if google_books_result:
@@ -1,5 +1,6 @@
 """Cover lookup service that tries multiple sources."""
 
+import logging
 from typing import Optional, List
 from interfaces.cover_lookup import CoverLookupInterface
 from services.google_books_cover import GoogleBooksCoverService
@@ -8,6 +9,8 @@ from services.ai_cover_generator import AICoverGeneratorService
 from services.openai_service import OpenAIService
 from models.book import Book
 
+logger = logging.getLogger(__name__)
+
 
 class CoverLookupService:
     """Service that tries multiple cover lookup sources in order."""
@@ -24,7 +27,7 @@ class CoverLookupService:
             ai_service = OpenAIService()
             self.services.append(AICoverGeneratorService(ai_service))
         except Exception as e:
-            print(f"Could not initialize AI cover generator: {e}")
+            logger.warning("Could not initialize AI cover generator: %s", e)
 
     async def download_cover(self, book: Book) -> Optional[str]:
         """Download cover image trying each service in order until one succeeds."""
@@ -39,13 +42,13 @@ class CoverLookupService:
                 if cover_path:
                     return cover_path
             except Exception as e:
-                print(f"Error with {service.__class__.__name__}: {e}")
+                logger.warning("Error with %s: %s", service.__class__.__name__, e)
                 continue
 
         # If no cover found from regular sources, inform user and try AI generation
         if ai_services:
-            print("No cover image found from available sources (Google Books, Goodreads).")
-            print("Generating AI cover image as fallback...")
+            logger.warning("No cover image found from available sources (Google Books, Goodreads).")
+            logger.info("Generating AI cover image as fallback...")
 
             for service in ai_services:
                 try:
@@ -53,16 +56,16 @@ class CoverLookupService:
                     if cover_path:
                         return cover_path
                 except Exception as e:
-                    print(f"Error with {service.__class__.__name__}: {e}")
+                    logger.warning("Error with %s: %s", service.__class__.__name__, e)
                     continue
 
             # If AI fallback failed, suggest --direct mode
-            print("Failed to generate AI cover image as fallback.")
-            print("Tip: Use the -d/--direct flag to skip cover image generation and create vector graphics directly from text.")
+            logger.warning("Failed to generate AI cover image as fallback.")
+            logger.warning("Tip: Use the -d/--direct flag to skip cover image generation and create vector graphics directly from text.")
         else:
             # No AI services available at all
-            print("No cover image found from available sources (Google Books, Goodreads).")
-            print("AI cover generation is not available (missing OPENAI_API_KEY).")
-            print("Tip: Use the -d/--direct flag to skip cover image generation and create vector graphics directly from text.")
+            logger.warning("No cover image found from available sources (Google Books, Goodreads).")
+            logger.warning("AI cover generation is not available (missing OPENAI_API_KEY).")
+            logger.warning("Tip: Use the -d/--direct flag to skip cover image generation and create vector graphics directly from text.")
 
         return None
@@ -1,12 +1,15 @@
 """Goodreads cover lookup service."""
 
-import aiohttp
+import logging
 import tempfile
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from typing import Optional
 from interfaces.cover_lookup import CoverLookupInterface
+from services.http_client import http_get
 from models.book import Book
 
+logger = logging.getLogger(__name__)
+
 
 class GoodreadsCoverService(CoverLookupInterface):
     """Goodreads web scraper service for looking up and downloading book covers."""
@@ -21,33 +24,32 @@ class GoodreadsCoverService(CoverLookupInterface):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                # Search for the book
-                async with session.get(search_url) as response:
-                    if response.status != 200:
-                        return None
-
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-
-                    # Find the book cover using the specific CSS path from BookPage__leftColumn
-                    book_cover = soup.select_one('.BookPage__leftColumn img')
-                    if book_cover:
-                        cover_url = book_cover.get('src')
-                        if cover_url and not cover_url.startswith('data:'):
-                            # Replace small covers with larger ones if possible
-                            if '_SX' in cover_url:
-                                cover_url = cover_url.replace('_SX98_', '_SX318_')
-                                cover_url = cover_url.replace('_SY160_', '_SY475_')
-                            return cover_url
-
+        try:
+            # Search for the book
+            async with http_get(search_url, headers=headers) as response:
+                if response.status != 200:
                     return None
 
-            except Exception as e:
-                print(f"Error getting cover URL from Goodreads: {e}")
+                html = await response.text()
+                tree = LexborHTMLParser(html)
+
+                # Find the book cover using the specific CSS path from BookPage__leftColumn
+                book_cover = tree.css_first('.BookPage__leftColumn img')
+                if book_cover:
+                    cover_url = book_cover.attributes.get('src')
+                    if cover_url and not cover_url.startswith('data:'):
+                        # Replace small covers with larger ones if possible
+                        if '_SX' in cover_url:
+                            cover_url = cover_url.replace('_SX98_', '_SX318_')
+                            cover_url = cover_url.replace('_SY160_', '_SY475_')
+                        return cover_url
+
                 return None
 
+        except Exception as e:
+            logger.warning("Error getting cover URL from Goodreads: %s", e)
+            return None
+
     async def download_cover(self, book: Book) -> Optional[str]:
         """Download cover image to a temporary file."""
         cover_url = await self.get_cover_url(book)
@@ -58,28 +60,27 @@ class GoodreadsCoverService(CoverLookupInterface):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                async with session.get(cover_url) as response:
-                    if response.status != 200:
-                        return None
+        try:
+            async with http_get(cover_url, headers=headers) as response:
+                if response.status != 200:
+                    return None
 
-                    # Determine file extension from URL or content type
-                    suffix = '.jpg'
-                    if cover_url.endswith('.png'):
+                # Determine file extension from URL or content type
+                suffix = '.jpg'
+                if cover_url.endswith('.png'):
+                    suffix = '.png'
+                elif 'content-type' in response.headers:
+                    content_type = response.headers['content-type']
+                    if 'png' in content_type:
                         suffix = '.png'
-                    elif 'content-type' in response.headers:
-                        content_type = response.headers['content-type']
-                        if 'png' in content_type:
-                            suffix = '.png'
-
-                    # Create temporary file
-                    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
-                        content = await response.read()
-                        tmp_file.write(content)
-                        print(f"Goodreads cover downloaded to: {tmp_file.name}")
-                        return tmp_file.name
-
-            except Exception as e:
-                print(f"Error downloading cover from Goodreads: {e}")
-                return None
+
+                # Create temporary file
+                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        tmp_file.write(chunk)
+                    logger.info("Goodreads cover downloaded to: %s", tmp_file.name)
+                    return tmp_file.name
+
+        except Exception as e:
+            logger.warning("Error downloading cover from Goodreads: %s", e)
+            return None
@@ -1,12 +1,31 @@
 """Goodreads web scraper for content lookup."""
 
-import aiohttp
-from bs4 import BeautifulSoup
-from typing import Optional
+from selectolax.lexbor import LexborHTMLParser
+from typing import Any, Dict, Optional
+import html
+import logging
 import re
 from interfaces.content_lookup import ContentLookupInterface
+from services.http_client import http_get
 from models.book import Book
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+_YEAR_RE = re.compile(r'(\d{4})')
+_PAGES_RE = re.compile(r'(\d+)\s+pages')
+
+# CSS selectors tried in order for each metadata field
+_TITLE_SELECTORS = ('h1[data-testid="bookTitle"]', 'h1.Text__title1', 'h1')
+_AUTHOR_SELECTORS = ('[data-testid="name"]', '.ContributorLink__name', 'a[href*="/author/show/"]')
+_PUB_SELECTORS = ('p[data-testid="publicationInfo"]', '.FeaturedDetails', '.BookPageMetadataSection__details')
+_PAGE_SELECTORS = ('.FeaturedDetails', '.BookPageMetadataSection__details')
+_DESC_SELECTORS = ('[data-testid="description"]', '.BookPageMetadataSection__description', '.expandableHtml')
+
+logger = logging.getLogger(__name__)
+
 
 class GoodreadsScraperService(ContentLookupInterface):
     """Goodreads web scraper service for looking up book metadata."""
@@ -22,111 +41,133 @@ class GoodreadsScraperService(ContentLookupInterface):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                # Search for the book (may redirect directly to book page)
-                async with session.get(search_url) as response:
-                    if response.status != 200:
-                        return None
-
+        try:
+            # The ISBN URL redirects straight to the book page, saving the search round trip
+            async with http_get(f"{self.BASE_URL}/book/isbn/{isbn}", headers=headers) as response:
+                if response.status == 200 and '/book/show/' in str(response.url):
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-
-                    # Check if we were redirected directly to a book page
-                    if '/book/show/' in str(response.url):
-                        # We're already on the book page, extract metadata directly
-                        return await self._extract_book_metadata(soup, isbn)
-                    else:
-                        # We're on search results page, find the first book
-                        book_links = soup.select('a[href*="/book/show/"]')
-                        if not book_links:
-                            return None
-
-                        # Get the first book link
-                        book_url = book_links[0].get('href')
-                        if not book_url.startswith('http'):
-                            book_url = self.BASE_URL + book_url
-
-                        # Get the book details page
-                        async with session.get(book_url) as book_response:
-                            if book_response.status != 200:
-                                return None
-
-                            book_html = await book_response.text()
-                            book_soup = BeautifulSoup(book_html, 'html.parser')
-                            return await self._extract_book_metadata(book_soup, isbn)
-
-            except Exception as e:
-                print(f"Error scraping Goodreads: {e}")
+                    return await self._extract_book_metadata(LexborHTMLParser(html), isbn)
+
+            # Fall back to search for the book (may redirect directly to book page)
+            async with http_get(search_url, headers=headers) as response:
+                if response.status != 200:
+                    return None
+
+                html = await response.text()
+                redirected = '/book/show/' in str(response.url)
+
+            tree = LexborHTMLParser(html)
+
+            # Check if we were redirected directly to a book page
+            if redirected:
+                # We're already on the book page, extract metadata directly
+                return await self._extract_book_metadata(tree, isbn)
+
+            # We're on search results page, find the first book
+            book_links = tree.css('a[href*="/book/show/"]')
+            if not book_links:
                 return None
 
-    async def _extract_book_metadata(self, soup: BeautifulSoup, isbn: str) -> Optional[Book]:
-        """Extract book metadata from a Goodreads book page."""
+            # Get the first book link
+            book_url = book_links[0].attributes.get('href')
+            if not book_url.startswith('http'):
+                book_url = self.BASE_URL + book_url
+
+            # Get the book details page once the search response is closed
+            async with http_get(book_url, headers=headers) as book_response:
+                if book_response.status != 200:
+                    return None
+
+                book_html = await book_response.text()
+
+            book_tree = LexborHTMLParser(book_html)
+            return await self._extract_book_metadata(book_tree, isbn)
+
+        except Exception as e:
+            logger.warning("Error scraping Goodreads: %s", e)
+            return None
+
+    def _extract_json_ld(self, tree: LexborHTMLParser) -> Dict[str, Any]:
+        """Return the embedded schema.org Book metadata, or an empty dict if absent."""
+        for script in tree.css('script[type="application/ld+json"]'):
+            try:
+                data = json_loads(script.text())
+            except ValueError:
+                continue
+            if isinstance(data, dict) and data.get('@type') == 'Book':
+                return data
+        return {}
+
+    async def _extract_book_metadata(self, tree: LexborHTMLParser, isbn: str) -> Optional[Book]:
+        """Extract book metadata from a Goodreads book page.
+
+        The JSON-LD block is read first; CSS selectors only fill in fields it lacks.
+        """
         try:
-            # Extract title - try multiple selectors
-            title = ''
-            title_selectors = ['h1[data-testid="bookTitle"]', 'h1.Text__title1', 'h1']
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    break
+            data = self._extract_json_ld(tree)
+
+            title = html.unescape(data.get('name') or '')
+            if not title:
+                for selector in _TITLE_SELECTORS:
+                    title_elem = tree.css_first(selector)
+                    if title_elem:
+                        title = title_elem.text(strip=True)
+                        break
 
-            # Extract author - try multiple selectors
-            author = ''
-            author_selectors = ['[data-testid="name"]', '.ContributorLink__name', 'a[href*="/author/show/"]']
-            for selector in author_selectors:
-                author_elem = soup.select_one(selector)
-                if author_elem:
-                    author = author_elem.get_text(strip=True)
-                    break
+            authors = data.get('author')
+            if isinstance(authors, dict):
+                authors = [authors]
+            author = html.unescape(authors[0].get('name') or '') if authors else ''
+            if not author:
+                for selector in _AUTHOR_SELECTORS:
+                    author_elem = tree.css_first(selector)
+                    if author_elem:
+                        author = author_elem.text(strip=True)
+                        break
 
             # Extract publication year - try multiple approaches
             pub_year = None
-            pub_selectors = ['p[data-testid="publicationInfo"]', '.FeaturedDetails', '.BookPageMetadataSection__details']
-            for selector in pub_selectors:
-                details = soup.select(selector)
+            for selector in _PUB_SELECTORS:
+                details = tree.css(selector)
                 for detail in details:
-                    text = detail.get_text()
-                    year_match = re.search(r'(\d{4})', text)
+                    text = detail.text()
+                    year_match = _YEAR_RE.search(text)
                     if year_match:
                         pub_year = int(year_match.group(1))
                         break
                 if pub_year:
                     break
 
-            # Extract page count - use the specific data-testid first, then fallbacks
-            pages = None
-            # Try the specific pagesFormat element first
-            pages_element = soup.select_one('p[data-testid="pagesFormat"]')
-            if pages_element:
-                text = pages_element.get_text()
-                pages_match = re.search(r'(\d+)\s+pages', text)
-                if pages_match:
-                    pages = int(pages_match.group(1))
+            pages = data.get('numberOfPages')
+            if not pages:
+                # Try the specific pagesFormat element first
+                pages_element = tree.css_first('p[data-testid="pagesFormat"]')
+                if pages_element:
+                    text = pages_element.text()
+                    pages_match = _PAGES_RE.search(text)
+                    if pages_match:
+                        pages = int(pages_match.group(1))
 
             # Fallback to other selectors if not found
             if not pages:
-                page_selectors = ['.FeaturedDetails', '.BookPageMetadataSection__details']
-                for selector in page_selectors:
-                    page_info = soup.select(selector)
+                for selector in _PAGE_SELECTORS:
+                    page_info = tree.css(selector)
                     for info in page_info:
-                        text = info.get_text()
-                        pages_match = re.search(r'(\d+)\s+pages', text)
+                        text = info.text()
+                        pages_match = _PAGES_RE.search(text)
                         if pages_match:
                             pages = int(pages_match.group(1))
                             break
                     if pages:
                         break
 
-            # Extract description - try multiple selectors
-            description = ''
-            desc_selectors = ['[data-testid="description"]', '.BookPageMetadataSection__description', '.expandableHtml']
-            for selector in desc_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    description = desc_elem.get_text(strip=True)
-                    break
+            description = html.unescape(data.get('description') or '')
+            if not description:
+                for selector in _DESC_SELECTORS:
+                    desc_elem = tree.css_first(selector)
+                    if desc_elem:
+                        description = desc_elem.text(strip=True)
+                        break
 
             if title and author:
                 return Book(
@@ -134,12 +175,12 @@ class GoodreadsScraperService(ContentLookupInterface):
                     title=title,
                     author=author,
                     publication_year=pub_year,
-                    pages=pages,
+                    pages=int(pages) if pages else None,
                     description=description
                 )
 
             return None
 
         except Exception as e:
-            print(f"Error extracting metadata: {e}")
+            logger.warning("Error extracting metadata: %s", e)
             return None
@@ -0,0 +1,82 @@
+"""Shared aiohttp client session for all HTTP requests."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+# Retry throttled or failing requests with exponential backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 3
+BASE_RETRY_DELAY = 0.5  # seconds, doubled on each attempt
+MAX_RETRY_DELAY = 30.0  # seconds
+
+# Maximum concurrent requests to a single host
+PER_HOST_CONCURRENCY = 5
+
+_session: Optional[aiohttp.ClientSession] = None
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared client session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=60, connect=10)
+        _session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared client session if it was opened."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def _retry_delay(response: Optional[aiohttp.ClientResponse], attempt: int) -> float:
+    """Return the delay before the next attempt, honoring Retry-After if present."""
+    if response is not None:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_DELAY)
+    return min(BASE_RETRY_DELAY * 2 ** (attempt - 1), MAX_RETRY_DELAY)
+
+
+@asynccontextmanager
+async def http_get(url: str, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+    """GET a URL with the shared session, bounded per host and retried on transient errors.
+
+    Usage mirrors session.get(): ``async with http_get(url) as response: ...``
+    The per-host limit covers only the request itself, so callers may nest
+    requests to the same host while a response is still open.
+    """
+    session = await get_session()
+    host = urlsplit(url).hostname or ''
+    semaphore = _host_semaphores.setdefault(host, asyncio.Semaphore(PER_HOST_CONCURRENCY))
+
+    async with semaphore:
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                response = await session.get(url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == MAX_ATTEMPTS:
+                    raise
+                await asyncio.sleep(_retry_delay(None, attempt))
+                continue
+
+            if response.status in RETRY_STATUSES and attempt < MAX_ATTEMPTS:
+                delay = _retry_delay(response, attempt)
+                response.release()
+                await asyncio.sleep(delay)
+                continue
+            break
+
+    try:
+        yield response
+    finally:
+        response.release()
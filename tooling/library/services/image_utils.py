@@ -0,0 +1,35 @@
+"""Helpers for preparing cover images before they are sent to an LLM."""
+
+import io
+
+# Downscale covers when Pillow is installed; otherwise they are sent as-is
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Longest edge in pixels; plenty of detail for a 236x327 stylized cover
+MAX_IMAGE_EDGE = 512
+JPEG_QUALITY = 75
+
+
+def shrink_image(raw: bytes) -> bytes:
+    """Return the image re-encoded as a JPEG no larger than MAX_IMAGE_EDGE.
+
+    Images that are already small enough, or that Pillow cannot read, are
+    returned unchanged.
+    """
+    if Image is None:
+        return raw
+
+    try:
+        with Image.open(io.BytesIO(raw)) as image:
+            if max(image.size) <= MAX_IMAGE_EDGE:
+                return raw
+
+            image.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE))
+            buffer = io.BytesIO()
+            image.convert('RGB').save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+            return buffer.getvalue()
+    except (OSError, ValueError):
+        return raw
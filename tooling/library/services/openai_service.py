@@ -1,18 +1,78 @@
 """OpenAI service implementation."""
 
-import base64
+import asyncio
+import json
+import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Literal, Optional, Union
 import openai
 from interfaces.llm_interface import LLMInterface
 from models.book import Book
+from services.image_utils import shrink_image
+from services.prompt_templates import render_template
+from services.svg_validator import is_complete_svg
+
+# Prefer the SIMD-accelerated encoder when it is installed
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Retries on rate limits, timeouts and connection errors; the SDK backs off
+# exponentially with jitter and honors Retry-After
+MAX_RETRIES = 5
+
+# Reasoning effort for SVG requests and the completion budget that goes with it.
+# Interactive calls start at DEFAULT_EFFORT and escalate to high if the SVG comes back incomplete.
+# The budget covers reasoning tokens too, so it leaves room for a full SVG after the reasoning.
+Effort = Literal["low", "medium", "high"]
+DEFAULT_EFFORT: Effort = "medium"
+# Batch jobs cannot escalate per request, and latency does not matter there
+BATCH_EFFORT: Effort = "high"
+SVG_MODEL = "gpt-5"
+TOKEN_BUDGET = {"low": 8000, "medium": 16000, "high": 32000}
+
+# Seconds between status checks while a batch is processing
+BATCH_POLL_INTERVAL = 30
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
 
 # Add parent directory to path to import shared utilities
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from shared.config import config_manager
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _read_prompt_template(template_name: str) -> str:
+    """Read a prompt template from disk once per process."""
+    template_path = Path(__file__).parent.parent / "prompts" / template_name
+    return template_path.read_text().strip()
+
+
+@lru_cache(maxsize=8)
+def _image_data_url_cached(image: Union[str, bytes], mtime_ns: Optional[int]) -> str:
+    """Encode an image once and share the data URL across all cover and banner calls."""
+    if isinstance(image, bytes):
+        raw = image
+    else:
+        with open(image, "rb") as image_file:
+            raw = image_file.read()
+
+    # Fewer pixels means fewer vision tokens and a smaller request
+    raw = shrink_image(raw)
+
+    return f"data:image/jpeg;base64,{base64.b64encode(raw).decode('ascii')}"
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> openai.AsyncOpenAI:
+    """Return one client per API key so every instance shares its connection pool."""
+    return openai.AsyncOpenAI(api_key=api_key, max_retries=MAX_RETRIES)
+
 
 class OpenAIService(LLMInterface):
     """OpenAI GPT-5 service for generating SVGs and cover images.
@@ -25,17 +85,17 @@ class OpenAIService(LLMInterface):
         if not api_key:
             raise ValueError("OPENAI_API_KEY is required (set environment variable or add to ~/.config/carinthia/config.json)")
 
-        self.client = openai.AsyncOpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
 
     def _load_prompt_template(self, template_name: str) -> str:
         """Load prompt template from file."""
-        template_path = Path(__file__).parent.parent / "prompts" / template_name
-        return template_path.read_text().strip()
+        return _read_prompt_template(template_name)
 
-    def _encode_image(self, image_path: str) -> str:
-        """Encode image to base64 string."""
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+    def _image_data_url(self, image: Union[str, bytes]) -> str:
+        """Encode image (file path or raw bytes) to a base64 data URL."""
+        # Key file paths on their mtime so a replaced file is re-encoded
+        mtime_ns = None if isinstance(image, bytes) else os.stat(image).st_mtime_ns
+        return _image_data_url_cached(image, mtime_ns)
 
     def _format_prompt(self, template: str, book: Book, cover_svg: str = None) -> str:
         """Format prompt template with book information."""
@@ -49,7 +109,7 @@ class OpenAIService(LLMInterface):
         if cover_svg is not None:
             format_dict['cover_svg'] = cover_svg
 
-        return template.format(**format_dict)
+        return render_template(template, format_dict)
 
     def _clean_reasoning_output(self, response: str) -> str:
         """Clean GPT-5 reasoning output to extract only the final prompt."""
@@ -65,17 +125,19 @@ class OpenAIService(LLMInterface):
         # Clean up extra whitespace and return clean prompt
         return response.strip()
 
-    async def generate_cover_svg(self, cover_image_path: str, book: Book) -> str:
-        """Generate a 236x327px cover SVG based on the original cover."""
-        template = self._load_prompt_template("cover_svg_prompt.txt")
-        prompt = self._format_prompt(template, book)
+    def svg_cache_key(self, batch: bool = False) -> str:
+        """Identify the model and reasoning settings that shape generated SVGs."""
+        effort = BATCH_EFFORT if batch else DEFAULT_EFFORT
+        return f"{SVG_MODEL}:{effort}:{TOKEN_BUDGET[effort]}"
 
+    def _image_request(self, cover_image_path: Union[str, bytes], prompt: str, effort: Effort) -> dict:
+        """Build chat.completions parameters for a prompt with the cover image attached."""
         # Encode the cover image
-        base64_image = self._encode_image(cover_image_path)
+        image_url = self._image_data_url(cover_image_path)
 
-        response = await self.client.chat.completions.create(
-            model="gpt-5",  # o1-preview doesn't support vision yet, use latest GPT-4 with vision
-            messages=[
+        return {
+            "model": SVG_MODEL,
+            "messages": [
                 {
                     "role": "user",
                     "content": [
@@ -83,89 +145,150 @@ class OpenAIService(LLMInterface):
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
+                                "url": image_url
                             }
                         }
                     ]
                 }
             ],
-            max_completion_tokens=16000,
-            temperature=1,
-            reasoning_effort="high"  # Use high reasoning effort for complex SVG generation
-        )
-
-        return response.choices[0].message.content.strip()
-
-    async def generate_banner_svg(self, cover_image_path: str, book: Book, cover_svg: str) -> str:
-        """Generate a 1024x200px banner SVG based on the original cover and stylized SVG cover."""
-        template = self._load_prompt_template("banner_svg_prompt.txt")
-        prompt = self._format_prompt(template, book, cover_svg)
-
-        # Encode the cover image
-        base64_image = self._encode_image(cover_image_path)
+            "max_completion_tokens": TOKEN_BUDGET[effort],
+            "temperature": 1,
+            "reasoning_effort": effort
+        }
 
-        response = await self.client.chat.completions.create(
-            model="gpt-5",  # GPT-5 with reasoning capabilities
-            messages=[
+    def _text_request(self, prompt: str, effort: Effort) -> dict:
+        """Build chat.completions parameters for a text-only prompt."""
+        return {
+            "model": SVG_MODEL,
+            "messages": [
                 {
                     "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
-                            }
-                        }
-                    ]
+                    "content": prompt
                 }
             ],
-            max_completion_tokens=16000,
-            temperature=1,
-            reasoning_effort="high"  # Use high reasoning effort for complex SVG generation
-        )
+            "max_completion_tokens": TOKEN_BUDGET[effort],
+            "temperature": 1,
+            "reasoning_effort": effort
+        }
 
-        return response.choices[0].message.content.strip()
+    def _cover_request(self, cover_image_path: Optional[Union[str, bytes]], book: Book,
+                       effort: Effort = DEFAULT_EFFORT) -> dict:
+        """Build request parameters for a cover SVG; no image selects direct mode."""
+        if cover_image_path is None:
+            template = self._load_prompt_template("direct_cover_svg_prompt.txt")
+            return self._text_request(self._format_prompt(template, book), effort)
 
-    async def generate_cover_svg_direct(self, book: Book) -> str:
-        """Generate a 236x327px cover SVG based solely on book text information."""
-        template = self._load_prompt_template("direct_cover_svg_prompt.txt")
-        prompt = self._format_prompt(template, book)
+        template = self._load_prompt_template("cover_svg_prompt.txt")
+        return self._image_request(cover_image_path, self._format_prompt(template, book), effort)
 
-        response = await self.client.chat.completions.create(
-            model="gpt-5",
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            max_completion_tokens=16000,
-            temperature=1,
-            reasoning_effort="high"  # Use high reasoning effort for creative design decisions
-        )
+    def _banner_request(self, cover_image_path: Optional[Union[str, bytes]], book: Book, cover_svg: str,
+                        effort: Effort = DEFAULT_EFFORT) -> dict:
+        """Build request parameters for a banner SVG; no image selects direct mode."""
+        if cover_image_path is None:
+            template = self._load_prompt_template("direct_banner_svg_prompt.txt")
+            return self._text_request(self._format_prompt(template, book, cover_svg), effort)
 
-        return response.choices[0].message.content.strip()
+        template = self._load_prompt_template("banner_svg_prompt.txt")
+        return self._image_request(cover_image_path, self._format_prompt(template, book, cover_svg), effort)
 
-    async def generate_banner_svg_direct(self, book: Book, cover_svg: str) -> str:
-        """Generate a 1024x200px banner SVG based solely on the stylized SVG cover."""
-        template = self._load_prompt_template("direct_banner_svg_prompt.txt")
-        prompt = self._format_prompt(template, book, cover_svg)
+    async def _generate_svg(self, build_request: Callable[[Effort], dict], effort: Effort) -> str:
+        """Request an SVG, retrying once with high effort if the result is incomplete."""
+        response = await self.client.chat.completions.create(**build_request(effort))
+        choice = response.choices[0]
+        # Content is None when reasoning used up the whole budget
+        svg = (choice.message.content or "").strip()
 
-        response = await self.client.chat.completions.create(
-            model="gpt-5",
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            max_completion_tokens=16000,
-            temperature=1,
-            reasoning_effort="high"  # Use high reasoning effort for creative design decisions
-        )
+        if effort != "high" and not is_complete_svg(svg):
+            logger.info("Incomplete SVG at %s reasoning effort (finish reason: %s), retrying with high",
+                        effort, choice.finish_reason)
+            return await self._generate_svg(build_request, "high")
+
+        return svg
+
+    async def generate_cover_svg(self, cover_image_path: Union[str, bytes], book: Book,
+                                 effort: Effort = DEFAULT_EFFORT) -> str:
+        """Generate a 236x327px cover SVG based on the original cover."""
+        return await self._generate_svg(
+            lambda e: self._cover_request(cover_image_path, book, e), effort)
 
-        return response.choices[0].message.content.strip()
+    async def generate_banner_svg(self, cover_image_path: Union[str, bytes], book: Book, cover_svg: str,
+                                  effort: Effort = DEFAULT_EFFORT) -> str:
+        """Generate a 1024x200px banner SVG based on the original cover and stylized SVG cover."""
+        return await self._generate_svg(
+            lambda e: self._banner_request(cover_image_path, book, cover_svg, e), effort)
+
+    async def generate_cover_svg_direct(self, book: Book, effort: Effort = DEFAULT_EFFORT) -> str:
+        """Generate a 236x327px cover SVG based solely on book text information."""
+        return await self._generate_svg(lambda e: self._cover_request(None, book, e), effort)
+
+    async def generate_banner_svg_direct(self, book: Book, cover_svg: str,
+                                         effort: Effort = DEFAULT_EFFORT) -> str:
+        """Generate a 1024x200px banner SVG based solely on the stylized SVG cover."""
+        return await self._generate_svg(lambda e: self._banner_request(None, book, cover_svg, e), effort)
+
+    async def _run_batch(self, requests: List[dict]) -> List[Optional[str]]:
+        """Run requests through the Batch API and return the SVGs in order.
+
+        Requests that did not succeed yield None.
+        """
+        if not requests:
+            return []
+
+        lines = [
+            json.dumps({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": params
+            })
+            for i, params in enumerate(requests)
+        ]
+        input_file = await self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("Submitted OpenAI batch %s with %s requests", batch.id, len(requests))
+
+        while batch.status not in BATCH_FINAL_STATUSES:
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        svgs: List[Optional[str]] = [None] * len(requests)
+        if not batch.output_file_id:
+            logger.warning("OpenAI batch %s %s without output", batch.id, batch.status)
+            return svgs
+
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                index = int(entry["custom_id"].rsplit('-', 1)[1])
+                svgs[index] = (response["body"]["choices"][0]["message"]["content"] or "").strip() or None
+            else:
+                logger.warning("OpenAI batch request %s failed: %s", entry["custom_id"], entry.get("error"))
+
+        return svgs
+
+    async def generate_cover_svgs_batch(self, cover_image_path: Optional[Union[str, bytes]], book: Book,
+                                        count: int) -> List[Optional[str]]:
+        """Generate several cover SVGs in one Batch API job."""
+        request = self._cover_request(cover_image_path, book, BATCH_EFFORT)
+        return await self._run_batch([request] * count)
+
+    async def generate_banner_svgs_batch(self, cover_image_path: Optional[Union[str, bytes]], book: Book,
+                                         cover_svgs: List[str]) -> List[Optional[str]]:
+        """Generate one banner SVG per cover SVG in one Batch API job."""
+        return await self._run_batch([
+            self._banner_request(cover_image_path, book, cover_svg, BATCH_EFFORT) for cover_svg in cover_svgs
+        ])
 
     async def generate_cover_image(self, book: Book) -> Optional[str]:
         """Generate an alternative cover image using GPT-5 enhanced prompts with DALL-E 3."""
@@ -175,7 +298,7 @@ class OpenAIService(LLMInterface):
         try:
             # Use GPT-5 to enhance and refine the image generation prompt
             enhancement_template = self._load_prompt_template("image_enhancement_prompt.txt")
-            enhancement_prompt = enhancement_template.format(base_prompt=base_prompt)
+            enhancement_prompt = render_template(enhancement_template, {'base_prompt': base_prompt})
 
             enhanced_prompt_response = await self.client.chat.completions.create(
                 model="gpt-5",
@@ -190,7 +313,7 @@ class OpenAIService(LLMInterface):
                 reasoning_effort="medium"
             )
 
-            enhanced_prompt = self._clean_reasoning_output(enhanced_prompt_response.choices[0].message.content)
+            enhanced_prompt = self._clean_reasoning_output(enhanced_prompt_response.choices[0].message.content or "")
 
             # Use the enhanced prompt for DALL-E 3 image generation
             response = await self.client.images.generate(
@@ -204,5 +327,5 @@ class OpenAIService(LLMInterface):
             return response.data[0].url
 
         except Exception as e:
-            print(f"Error generating cover image with GPT-5 + DALL-E 3: {e}")
+            logger.warning("Error generating cover image with GPT-5 + DALL-E 3: %s", e)
             return None
@@ -0,0 +1,27 @@
+"""Precompiled prompt template rendering."""
+
+from functools import lru_cache
+from string import Formatter
+from typing import Mapping, Tuple
+
+_formatter = Formatter()
+
+
+@lru_cache(maxsize=None)
+def _compile_template(template: str) -> Tuple[Tuple[str, str], ...]:
+    """Split a str.format template into (literal text, field name) pairs once."""
+    parts = []
+    for literal, field_name, format_spec, conversion in _formatter.parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported placeholder in prompt template: {{{field_name}}}")
+        parts.append((literal, field_name or ''))
+    return tuple(parts)
+
+
+def render_template(template: str, values: Mapping[str, object]) -> str:
+    """Fill a prompt template's {placeholders}, equivalent to template.format(**values)."""
+    try:
+        return ''.join(literal + (str(values[field]) if field else '')
+                       for literal, field in _compile_template(template))
+    except KeyError as e:
+        raise ValueError(f"Prompt template needs a value for {e}") from None
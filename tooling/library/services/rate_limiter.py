@@ -0,0 +1,26 @@
+"""Request-rate limiting for LLM provider calls."""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Spaces requests evenly so that at most `qpm` start in any minute."""
+
+    def __init__(self, qpm: float):
+        self.interval = 60.0 / qpm if qpm > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is free."""
+        if not self.interval:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -1,14 +1,58 @@
 """Simple SVG text overflow detection and correction."""
 
+import asyncio
+import logging
 import re
-from typing import Optional
+from dataclasses import dataclass, replace
+from typing import Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# Attributes the fixer reads, matched on whole attribute names so dx="..." is not read as x
+_ATTR_RE = re.compile(r'\s(x|font-size|text-anchor|textLength|style)="([^"]*)"')
+_NUM_RE = re.compile(r'([\d.]+)')
+
+# Declarations inside a style attribute
+_FONT_SIZE_STYLE_RE = re.compile(r'font-size:\s*([\d.]+)')
+_FONT_SIZE_DECL_RE = re.compile(r'font-size:\s*[\d.]+[^;]*')
+_ANCHOR_STYLE_RE = re.compile(r'text-anchor:\s*([^;]+)')
+
+# Approximate advance widths of ASCII characters in em, for a typical sans-serif
+_CHAR_WIDTHS = [0.55] * 128
+for _chars, _width in (
+    (' iIjlt|!.,:;\'', 0.28),
+    ('fr()[]-', 0.33),
+    ('0123456789', 0.56),
+    ('ABCDEFGHJKLNOPQRSTUVXYZ', 0.67),
+    ('mw', 0.83),
+    ('MW@', 0.92),
+):
+    for _char in _chars:
+        _CHAR_WIDTHS[ord(_char)] = _width
+del _chars, _width, _char
+
+
+@dataclass(slots=True)
+class TextAttrs:
+    """Layout attributes of one <text> element, parsed once per element."""
+    x: Optional[float]
+    font_size: float
+    anchor: str
+    text_length: Optional[float]
+    text: str
+    # Matches on the element string, kept so fixes can splice values in place
+    x_match: Optional[re.Match] = None
+    font_size_match: Optional[re.Match] = None
+    style_match: Optional[re.Match] = None
 
 
 class SimpleOverflowFixer:
     """Minimal SVG text overflow correction service."""
 
     def __init__(self):
-        # Character width estimation (conservative)
+        # Character width estimation (conservative) for characters outside the ASCII table
         self.avg_char_width = 0.7  # Average character width relative to font size
 
     def fix_overflow(self, svg_content: str, svg_type: str = 'cover') -> str:
@@ -21,64 +65,169 @@ class SimpleOverflowFixer:
         Returns:
             Corrected SVG content (or original if no fixes needed)
         """
+        if svg_type == 'banner':
+            return self.fix_overflow_banner(svg_content)
+        return self.fix_overflow_cover(svg_content)
+
+    async def afix_overflow(self, svg_content: str, svg_type: str = 'cover') -> str:
+        """Run fix_overflow in a worker thread so the event loop stays free."""
+        return await asyncio.to_thread(self.fix_overflow, svg_content, svg_type)
+
+    def fix_overflow_cover(self, svg_content: str) -> str:
+        """Apply minimal overflow fixes to a 236px wide cover SVG."""
+        return self._fix_overflow(svg_content, 236, 10, 'cover')
+
+    def fix_overflow_banner(self, svg_content: str) -> str:
+        """Apply minimal overflow fixes to a 1024px wide banner SVG."""
+        return self._fix_overflow(svg_content, 1024, 10, 'banner')
+
+    def _fix_overflow(self, svg_content: str, width: int, safe_margin: int, svg_type: str) -> str:
+        """Apply minimal fixes for the given canvas width and margin."""
+        # Decorative SVGs often have no text at all; skip the regex scan for them
+        if '<text' not in svg_content:
+            return svg_content
+
         try:
-            if svg_type == 'banner':
-                width = 1024
-                safe_margin = 10
-            else:  # cover
-                width = 236
-                safe_margin = 10
-
-            corrected_svg = svg_content
+            # Stitch the output together in one pass instead of replacing each fix in place
+            parts = []
+            last_end = 0
             fixes_applied = False
 
             # Find text elements that might be problematic
-            text_elements = self._find_text_elements(svg_content)
-
-            for match in text_elements:
-                if self._appears_to_overflow(match, width, safe_margin):
-                    fixed_element = self._apply_minimal_fix(match, width, safe_margin)
-                    if fixed_element != match.group(0):
-                        corrected_svg = corrected_svg.replace(match.group(0), fixed_element)
+            for start, end, text_element in self._find_text_elements(svg_content):
+                attrs = self._parse_text(text_element)
+                if self._appears_to_overflow(attrs, width, safe_margin):
+                    fixed_element = self._apply_minimal_fix(text_element, attrs, width, safe_margin)
+                    if fixed_element != text_element:
+                        parts.append(svg_content[last_end:start])
+                        parts.append(fixed_element)
+                        last_end = end
                         fixes_applied = True
 
-            if fixes_applied:
-                print(f"Applied minimal overflow fixes to {svg_type}")
+            if not fixes_applied:
+                return svg_content
 
-            return corrected_svg
+            parts.append(svg_content[last_end:])
+            logger.info("Applied minimal overflow fixes to %s", svg_type)
+            return ''.join(parts)
 
         except Exception as e:
-            print(f"Error in overflow fixer: {e}")
+            logger.warning("Error in overflow fixer: %s", e)
             return svg_content
 
-    def _find_text_elements(self, svg_content: str) -> list:
-        """Find text elements that might need fixing."""
-        # Pattern to match text elements with their attributes
-        pattern = r'<text[^>]*>.*?</text>'
-        return list(re.finditer(pattern, svg_content, re.DOTALL))
+    def _find_text_elements(self, svg_content: str) -> Iterator[Tuple[int, int, str]]:
+        """Find text elements that might need fixing.
 
-    def _appears_to_overflow(self, text_match, canvas_width: int, margin: int) -> bool:
-        """Simple heuristic to detect potential overflow."""
-        text_element = text_match.group(0)
+        Yields (start, end, element) for each <text>...</text>, scanning
+        linearly with str.find rather than a backtracking regex.
+        """
+        pos = 0
+        while True:
+            start = svg_content.find('<text', pos)
+            if start < 0:
+                return
+
+            # Skip <textPath> and other tags that merely start with "text"
+            name_end = start + len('<text')
+            if svg_content[name_end:name_end + 1] not in (' ', '\t', '\n', '\r', '>', '/'):
+                pos = name_end
+                continue
+
+            open_end = svg_content.find('>', name_end)
+            if open_end < 0:
+                return
+
+            # A self-closing <text/> has no content to overflow
+            if svg_content[open_end - 1] == '/':
+                pos = open_end + 1
+                continue
+
+            close = svg_content.find('</text>', open_end)
+            if close < 0:
+                return
+
+            end = close + len('</text>')
+            yield start, end, svg_content[start:end]
+            pos = end
+
+    def _parse_text(self, text_element: str) -> TextAttrs:
+        """Read the attributes of a text element's opening tag in a single scan.
+
+        Attributes of child tspans are ignored.
+        """
+        open_tag = text_element[:text_element.find('>') + 1]
+        matches = {}
+        for match in _ATTR_RE.finditer(open_tag):
+            matches.setdefault(match.group(1), match)
 
-        # Extract x position
-        x_match = re.search(r'x="([^"]*)"', text_element)
-        if not x_match:
-            return False
+        x = self._to_float(matches.get('x'))
 
+        style_match = matches.get('style')
+        style = style_match.group(2) if style_match else ''
+
+        # Font size from the attribute, then the style attribute
+        font_size = None
+        font_size_match = matches.get('font-size')
+        if font_size_match:
+            size_match = _NUM_RE.search(font_size_match.group(2))
+            if size_match:
+                font_size = float(size_match.group(1))
+        if font_size is None and style:
+            style_size_match = _FONT_SIZE_STYLE_RE.search(style)
+            if style_size_match:
+                font_size = float(style_size_match.group(1))
+
+        # Text anchor from the attribute, then the style attribute
+        anchor = 'start'  # Default SVG text-anchor value
+        if 'text-anchor' in matches:
+            anchor = matches['text-anchor'].group(2)
+        elif style:
+            anchor_style_match = _ANCHOR_STYLE_RE.search(style)
+            if anchor_style_match:
+                anchor = anchor_style_match.group(1).strip()
+
+        return TextAttrs(
+            x=x,
+            font_size=font_size if font_size is not None else 16.0,  # Default font size
+            anchor=anchor,
+            text_length=self._to_float(matches.get('textLength')),
+            text=_TAG_RE.sub(' ', text_element).strip(),
+            x_match=matches.get('x'),
+            font_size_match=font_size_match,
+            style_match=style_match,
+        )
+
+    def _to_float(self, attr_match: Optional[re.Match]) -> Optional[float]:
+        """Return an attribute match's value as a float, or None if absent or not numeric."""
+        if not attr_match:
+            return None
         try:
-            x_pos = float(x_match.group(1))
+            return float(attr_match.group(2))
         except ValueError:
-            return False
+            return None
+
+    def _replace_value(self, text_element: str, attr_match: re.Match, new_value: str) -> str:
+        """Replace the attribute value captured by attr_match in place."""
+        return text_element[:attr_match.start(2)] + new_value + text_element[attr_match.end(2):]
 
-        # Get text width (preferring textLength if available)
-        text_width = self._get_text_width(text_element)
+    def _get_text_width(self, attrs: TextAttrs) -> float:
+        """Get text width, preferring textLength if available, otherwise estimate."""
+        # textLength is the most accurate
+        if attrs.text_length is not None:
+            return attrs.text_length
+
+        # Fallback to estimation from per-character widths
+        width_em = sum(_CHAR_WIDTHS[ord(char)] if ord(char) < 128 else self.avg_char_width
+                       for char in attrs.text)
+        return width_em * attrs.font_size
 
-        # Get text anchor to determine how x position relates to text bounds
-        text_anchor = self._extract_text_anchor(text_element)
+    def _appears_to_overflow(self, attrs: TextAttrs, canvas_width: int, margin: int) -> bool:
+        """Simple heuristic to detect potential overflow."""
+        if attrs.x is None:
+            return False
 
         # Calculate actual left and right edges based on text-anchor
-        left_edge, right_edge = self._calculate_text_bounds(x_pos, text_width, text_anchor)
+        left_edge, right_edge = self._calculate_text_bounds(attrs.x, self._get_text_width(attrs), attrs.anchor)
 
         # Check if text overflows beyond safe boundaries
         safe_left = margin
@@ -89,64 +238,6 @@ class SimpleOverflowFixer:
 
         return overflows_left or overflows_right
 
-    def _extract_font_size(self, text_element: str) -> float:
-        """Extract font size from text element."""
-        # Check font-size attribute
-        font_size_match = re.search(r'font-size="([^"]*)"', text_element)
-        if font_size_match:
-            size_str = font_size_match.group(1)
-            # Extract numeric part
-            size_match = re.search(r'([\d.]+)', size_str)
-            if size_match:
-                return float(size_match.group(1))
-
-        # Check style attribute for font-size
-        style_match = re.search(r'style="([^"]*)"', text_element)
-        if style_match:
-            style = style_match.group(1)
-            font_size_match = re.search(r'font-size:\s*([\d.]+)', style)
-            if font_size_match:
-                return float(font_size_match.group(1))
-
-        return 16.0  # Default font size
-
-    def _extract_text_content(self, text_element: str) -> str:
-        """Extract text content from element."""
-        # Remove tags and get content
-        content = re.sub(r'<[^>]*>', ' ', text_element)
-        return content.strip()
-
-    def _get_text_width(self, text_element: str) -> float:
-        """Get text width, preferring textLength if available, otherwise estimate."""
-        # Check for textLength attribute (most accurate)
-        textlength_match = re.search(r'textLength="([^"]*)"', text_element)
-        if textlength_match:
-            try:
-                return float(textlength_match.group(1))
-            except ValueError:
-                pass
-
-        # Fallback to estimation
-        font_size = self._extract_font_size(text_element)
-        text_content = self._extract_text_content(text_element)
-        return len(text_content) * font_size * self.avg_char_width
-
-    def _extract_text_anchor(self, text_element: str) -> str:
-        """Extract text-anchor value, defaulting to 'start'."""
-        anchor_match = re.search(r'text-anchor="([^"]*)"', text_element)
-        if anchor_match:
-            return anchor_match.group(1)
-
-        # Check in style attribute
-        style_match = re.search(r'style="([^"]*)"', text_element)
-        if style_match:
-            style = style_match.group(1)
-            anchor_style_match = re.search(r'text-anchor:\s*([^;]+)', style)
-            if anchor_style_match:
-                return anchor_style_match.group(1).strip()
-
-        return 'start'  # Default SVG text-anchor value
-
     def _calculate_text_bounds(self, x_pos: float, text_width: float, text_anchor: str) -> tuple[float, float]:
         """Calculate left and right edges based on x position, width, and anchor."""
         if text_anchor == 'middle':
@@ -165,33 +256,33 @@ class SimpleOverflowFixer:
 
         return left_edge, right_edge
 
-    def _apply_minimal_fix(self, text_match, canvas_width: int, margin: int) -> str:
+    def _apply_minimal_fix(self, text_element: str, attrs: TextAttrs, canvas_width: int, margin: int) -> str:
         """Apply minimal correction to text element."""
-        text_element = text_match.group(0)
-
         # Try repositioning first (less invasive)
-        fixed_element = self._try_reposition(text_element, canvas_width, margin)
+        fixed_element, new_x = self._try_reposition(text_element, attrs, canvas_width, margin)
 
-        # If repositioning isn't enough, try small font reduction
-        if self._appears_to_overflow_after_fix(fixed_element, canvas_width, margin):
-            fixed_element = self._try_font_reduction(fixed_element)
+        # If repositioning isn't enough, try small font reduction. Only x moved,
+        # so the bounds are rechecked without parsing the element again.
+        if self._appears_to_overflow(replace(attrs, x=new_x), canvas_width, margin):
+            if fixed_element != text_element:
+                # The new x value shifted the positions the font-size edit splices at
+                attrs = self._parse_text(fixed_element)
+            fixed_element = self._try_font_reduction(fixed_element, attrs)
 
         return fixed_element
 
-    def _try_reposition(self, text_element: str, canvas_width: int, margin: int) -> str:
-        """Try to fix overflow by adjusting position."""
-        x_match = re.search(r'x="([^"]*)"', text_element)
-        if not x_match:
-            return text_element
+    def _try_reposition(self, text_element: str, attrs: TextAttrs, canvas_width: int,
+                        margin: int) -> Tuple[str, Optional[float]]:
+        """Try to fix overflow by adjusting position.
 
-        try:
-            x_pos = float(x_match.group(1))
-        except ValueError:
-            return text_element
+        Returns the element and the x position it now has.
+        """
+        if attrs.x is None:
+            return text_element, None
 
-        # Get text properties for correct calculation
-        text_width = self._get_text_width(text_element)
-        text_anchor = self._extract_text_anchor(text_element)
+        x_pos = attrs.x
+        text_width = self._get_text_width(attrs)
+        text_anchor = attrs.anchor
 
         # Calculate current bounds
         left_edge, right_edge = self._calculate_text_bounds(x_pos, text_width, text_anchor)
@@ -229,49 +320,30 @@ class SimpleOverflowFixer:
 
         # Apply the new position if it changed
         if abs(new_x - x_pos) > 0.1:  # Only update if significant change
-            return text_element.replace(f'x="{x_match.group(1)}"', f'x="{new_x:.1f}"')
+            new_x_str = f'{new_x:.1f}'
+            return self._replace_value(text_element, attrs.x_match, new_x_str), float(new_x_str)
 
-        return text_element
+        return text_element, x_pos
 
-    def _try_font_reduction(self, text_element: str) -> str:
+    def _try_font_reduction(self, text_element: str, attrs: TextAttrs) -> str:
         """Apply small font size reduction."""
-        current_size = self._extract_font_size(text_element)
-
         # Reduce by 10% (minimal impact on legibility)
-        new_size = current_size * 0.9
+        new_size = attrs.font_size * 0.9
         new_size = max(new_size, 10)  # Don't go below 10px
 
         # Update font-size attribute if it exists
-        font_size_match = re.search(r'font-size="([^"]*)"', text_element)
-        if font_size_match:
-            return text_element.replace(
-                f'font-size="{font_size_match.group(1)}"',
-                f'font-size="{new_size}px"'
-            )
+        if attrs.font_size_match:
+            return self._replace_value(text_element, attrs.font_size_match, f'{new_size}px')
 
         # Update style attribute if it exists
-        style_match = re.search(r'style="([^"]*)"', text_element)
-        if style_match:
-            style = style_match.group(1)
+        if attrs.style_match:
+            style = attrs.style_match.group(2)
             if 'font-size:' in style:
-                new_style = re.sub(r'font-size:\s*[\d.]+[^;]*', f'font-size:{new_size}px', style)
-                return text_element.replace(f'style="{style}"', f'style="{new_style}"')
+                new_style = _FONT_SIZE_DECL_RE.sub(f'font-size:{new_size}px', style)
             else:
                 # Add font-size to existing style
                 new_style = style.rstrip(';') + f';font-size:{new_size}px'
-                return text_element.replace(f'style="{style}"', f'style="{new_style}"')
+            return self._replace_value(text_element, attrs.style_match, new_style)
 
         # Add font-size attribute if no existing size found
-        return text_element.replace('<text', f'<text font-size="{new_size}px"')
-
-    def _appears_to_overflow_after_fix(self, text_element: str, canvas_width: int, margin: int) -> bool:
-        """Quick check if element still appears to overflow after initial fix."""
-        # Create a fake match object for the updated element
-        class FakeMatch:
-            def __init__(self, content):
-                self.content = content
-            def group(self, n):
-                return self.content
-
-        fake_match = FakeMatch(text_element)
-        return self._appears_to_overflow(fake_match, canvas_width, margin)
+        return text_element.replace('<text', f'<text font-size="{new_size}px"', 1)
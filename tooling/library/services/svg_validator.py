@@ -0,0 +1,11 @@
+"""Lightweight checks on LLM-generated SVG output."""
+
+
+def is_complete_svg(svg: str) -> bool:
+    """Return True if the output holds a whole <svg> document.
+
+    Responses cut off by the completion token limit stop before the closing
+    tag, which is the common failure at lower reasoning budgets. A trailing
+    code fence after the closing tag is tolerated.
+    """
+    return '<svg' in svg and '</svg>' in svg
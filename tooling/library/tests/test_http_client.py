@@ -0,0 +1,48 @@
+"""Tests for the shared HTTP client.
+
+Run from tooling/library with: python -m unittest discover tests
+"""
+
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from services import http_client
+
+
+class NestedSameHostRequestsTest(unittest.IsolatedAsyncioTestCase):
+    """Requests nested inside an open response to the same host must not deadlock."""
+
+    async def asyncSetUp(self):
+        app = web.Application()
+        app.router.add_get('/search', lambda request: web.Response(text='search'))
+        app.router.add_get('/book', lambda request: web.Response(text='book'))
+        self.server = TestServer(app)
+        await self.server.start_server()
+        http_client._host_semaphores.clear()
+
+    async def asyncTearDown(self):
+        await http_client.close_session()
+        http_client._host_semaphores.clear()
+        await self.server.close()
+
+    async def test_more_nested_lookups_than_host_permits(self):
+        lookups = http_client.PER_HOST_CONCURRENCY + 1
+        # Every lookup holds its outer response open until all of them have one
+        all_open = asyncio.Barrier(lookups)
+
+        async def lookup() -> str:
+            async with http_client.http_get(str(self.server.make_url('/search'))) as response:
+                await response.text()
+                await all_open.wait()
+                async with http_client.http_get(str(self.server.make_url('/book'))) as book_response:
+                    return await book_response.text()
+
+        results = await asyncio.wait_for(asyncio.gather(*(lookup() for _ in range(lookups))), timeout=10)
+        self.assertEqual(results, ['book'] * lookups)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,10 +23,7 @@ class ConfigManager:
         if self._config_cache is not None:
             return self._config_cache
 
-        if not self.config_path.exists():
-            self._config_cache = {}
-            return self._config_cache
-
+        # A missing file is just another OSError; no separate exists() stat
         try:
             with open(self.config_path, 'r') as f:
                 self._config_cache = json.load(f)